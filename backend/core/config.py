@@ -1,7 +1,11 @@
 from functools import lru_cache
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Preprocessing steps understood by the OCR cascade (see core/ocr.py).
+OCR_PREPROCESS_STEPS = ("none", "gray", "threshold", "sharpen")
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -14,7 +18,56 @@ class Settings(BaseSettings):
     ocr_provider: str = "tesseract"
     tesseract_lang: str = "eng"
     tesseract_cmd: str | None = None
+    ocr_cascade: bool = False
+    ocr_fast_max_side: int = 1200
+    ocr_fast_psm: int = 6
+    ocr_cascade_min_confidence: float = 0.75
+    ocr_cascade_min_fields: int = 2
+    ocr_cascade_variants: str = "3,11,6:threshold"
     allow_origin: str = "http://localhost:3000"
+    log_level: str = "INFO"
+    warmup_steps: str = "db,ocr,llm"
+    extract_idempotency_ttl_seconds: int = 600
+    fuzzy_max_key_frequency: int = 500
+    dedupe_scan_interval_seconds: int = 300
+    dedupe_min_score: float = 0.6
+    dedupe_max_block_size: int = 200
+    dedupe_scan_batch_size: int = 200
+    profile_sample_rate: float = 0.0
+    profile_admin_token: str | None = None
+    profile_sample_interval_ms: float = 5.0
+    profile_max_entries: int = 50
+    profile_max_sql_entries: int = 200
+    slow_request_ms: float = 2000.0
+    shared_store_path: str = "./shared_cache.db"
+    shared_cache_ttl_seconds: int = 86400
+    llm_max_concurrency: int = 8
+    llm_rate_per_minute: int = 0
+    llm_lease_seconds: float = 300
+    improve_chunk_size: int = 20
+    improve_chunk_chars: int = 6000
+    improve_concurrency: int = 4
+    improve_max_retries: int = 2
+    improve_store_ttl_seconds: int = 30 * 24 * 3600
+
+    @field_validator("ocr_cascade_variants")
+    @classmethod
+    def check_ocr_variants(cls, value: str) -> str:
+        """Reject malformed ``psm[:preprocess]`` specs at startup rather than on every upload."""
+        for spec in filter(None, (part.strip() for part in value.split(","))):
+            psm, _, preprocess = spec.partition(":")
+            if not psm.isdigit() or not 0 <= int(psm) <= 13:
+                raise ValueError(f"Invalid page segmentation mode in OCR variant {spec!r}")
+            if (preprocess or "none") not in OCR_PREPROCESS_STEPS:
+                raise ValueError(f"Unknown preprocessing step in OCR variant {spec!r}")
+        return value
+
+    @field_validator("ocr_fast_psm")
+    @classmethod
+    def check_ocr_fast_psm(cls, value: int) -> int:
+        if not 0 <= value <= 13:
+            raise ValueError("OCR_FAST_PSM must be a Tesseract page segmentation mode (0-13)")
+        return value
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,72 @@
+"""
+Helpers for typo-tolerant name matching: character trigrams plus a Soundex phonetic key.
+"""
+
+import re
+
+# Digits OCR commonly produces in place of letters ("0livia", "J1ll").
+_OCR_DIGITS = str.maketrans({"0": "o", "1": "l", "3": "e", "4": "a", "5": "s", "8": "b"})
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def normalize_name(raw: str | None) -> list[str]:
+    """Lowercase, undo common OCR digit swaps, and split a name into letter-only tokens."""
+    if not raw:
+        return []
+    value = raw.lower().translate(_OCR_DIGITS)
+    return re.findall(r"[a-z]+", value)
+
+
+def name_trigrams(tokens: list[str]) -> set[str]:
+    trigrams: set[str] = set()
+    for token in tokens:
+        padded = f"  {token} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def soundex(token: str) -> str:
+    if not token:
+        return ""
+    code = token[0].upper()
+    previous = _SOUNDEX_CODES.get(token[0], "")
+    for char in token[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+        if char not in "hw":
+            previous = digit
+    return (code + "000")[:4]
+
+
+def name_keys(raw: str | None) -> set[str]:
+    """Index keys for a name: ``t:`` trigrams and ``p:`` phonetic codes."""
+    tokens = normalize_name(raw)
+    keys = {f"t:{trigram}" for trigram in name_trigrams(tokens)}
+    keys.update(f"p:{soundex(token)}" for token in tokens)
+    return keys
+
+
+def name_similarity(query: str | None, candidate: str | None) -> float:
+    """Blend of trigram Dice similarity and phonetic token overlap, between 0 and 1."""
+    query_tokens = normalize_name(query)
+    candidate_tokens = normalize_name(candidate)
+    if not query_tokens or not candidate_tokens:
+        return 0.0
+
+    query_trigrams = name_trigrams(query_tokens)
+    candidate_trigrams = name_trigrams(candidate_tokens)
+    shared = len(query_trigrams & candidate_trigrams)
+    trigram_score = 2 * shared / (len(query_trigrams) + len(candidate_trigrams))
+
+    candidate_codes = {soundex(token) for token in candidate_tokens}
+    phonetic_score = sum(soundex(token) in candidate_codes for token in query_tokens) / len(query_tokens)
+
+    return round(0.5 * trigram_score + 0.5 * phonetic_score, 4)
@@ -1,24 +1,39 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import importlib
 import importlib.util
 import json
+import logging
+import os
+import random
+import uuid
+import weakref
+from contextlib import asynccontextmanager, nullcontext
 from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from backend.core.config import get_settings
+from backend.core.shared_store import get_shared_store
 
-_SPEC = importlib.util.find_spec("google.generativeai")
-if _SPEC:  # pragma: no branch - simple import guard
-    genai = importlib.import_module("google.generativeai")
-else:  # pragma: no cover
-    genai = None
+logger = logging.getLogger(__name__)
 
 _MODEL_NAME = "models/gemini-2.0-flash"
 
+# Short keys used when sending contacts to the model; the legend is embedded in the prompt.
+_COMPACT_KEYS = {
+    "name": "n",
+    "phone": "p",
+    "email": "e",
+    "company": "c",
+    "notes": "o",
+    "confidence": "cf",
+    "extra": "x",
+}
+
 
 class Contact(BaseModel):
     name: str | None = None
@@ -34,6 +49,10 @@ class ContactResponse(BaseModel):
     contacts: list[Contact] = Field(default_factory=list)
 
 
+class ImproveResponse(ContactResponse):
+    meta: dict[str, Any] = Field(default_factory=dict)
+
+
 _STRUCTURE_PROMPT = """You are a contact card extraction assistant. Given OCR text, return ONLY valid JSON matching this schema:
 {
   "contacts": [
@@ -74,7 +93,7 @@ _IMPROVE_PROMPT = """You are improving previously extracted contact data. Return
   ]
 }}
 
-Existing contacts (JSON):
+Existing contacts (compact JSON array; keys: n=name, p=phone, e=email, c=company, o=notes, cf=confidence, x=extra; missing keys are null):
 {contacts_json}
 
 Additional guidance: {instructions}
@@ -86,6 +105,7 @@ Rules:
 - **ENRICHMENT**: If you can deduce additional info (social media handles, website from email domain), add to extra object.
 - Keep phone/email formatting consistent.
 - Preserve any notes or extra data if still relevant.
+- Return exactly one contact per input contact, in the same order, using the full field names above.
 - MUST wrap the array in a "contacts" field.
 """
 
@@ -115,11 +135,20 @@ def _extract_response_text(response: Any) -> str:
     raise ValueError("LLM response did not contain text output")
 
 
+@lru_cache(maxsize=1)
+def _load_genai() -> Any:
+    """Import the Gemini SDK on first use; it is heavy and not needed to serve /health."""
+    if importlib.util.find_spec("google.generativeai") is None:  # pragma: no cover
+        return None
+    return importlib.import_module("google.generativeai")
+
+
 @lru_cache(maxsize=1)
 def _get_model() -> Any:
     settings = get_settings()
     if not settings.gemini_api_key:
         raise RuntimeError("GEMINI_API_KEY is not configured")
+    genai = _load_genai()
     if genai is None:  # pragma: no cover - runtime guard
         raise RuntimeError(
             "google-generativeai is not installed. Install it or choose another LLM provider."
@@ -128,13 +157,73 @@ def _get_model() -> Any:
     return genai.GenerativeModel(_MODEL_NAME)
 
 
+async def warmup_llm() -> None:
+    """Import the SDK and create the model client ahead of the first request."""
+    if not get_settings().gemini_api_key:
+        return
+    await asyncio.to_thread(_get_model)
+
+
+_local_llm_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _local_llm_semaphore(limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _local_llm_slots.get(loop)
+    if semaphore is None:
+        semaphore = _local_llm_slots[loop] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def _backoff(attempt: int) -> None:
+    """Sleep with capped exponential backoff and jitter between shared-store polls."""
+    delay = min(0.05 * 2**attempt, 1.0)
+    await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+
+@asynccontextmanager
+async def _llm_budget():
+    """Hold one slot of the host-wide LLM budget, shared by all worker processes.
+
+    A per-process semaphore admits at most ``llm_max_concurrency`` calls before they touch
+    the shared store, so queued calls wait on the event loop instead of polling SQLite from
+    executor threads that OCR and Gemini calls also need.
+    """
+    settings = get_settings()
+    store = get_shared_store()
+    limited = settings.llm_max_concurrency > 0
+    async with _local_llm_semaphore(max(settings.llm_max_concurrency, 1)) if limited else nullcontext():
+        if settings.llm_rate_per_minute > 0:
+            rate = settings.llm_rate_per_minute / 60
+            while (wait := await store.atake_token("llm", rate, max(settings.llm_max_concurrency, 1))) > 0:
+                await asyncio.sleep(wait * random.uniform(1.0, 1.2))
+
+        holder = f"{os.getpid()}:{uuid.uuid4().hex}"
+        attempt = 0
+        # Leases expire so a crashed worker cannot hold a slot forever.
+        while limited and not await store.atry_acquire(
+            "llm", holder, settings.llm_max_concurrency, settings.llm_lease_seconds
+        ):
+            await _backoff(attempt)
+            attempt += 1
+        try:
+            yield
+        finally:
+            if limited:
+                await store.arelease("llm", holder)
+
+
 async def _invoke_model(prompt: str) -> ContactResponse:
-    model = _get_model()
-    response = await asyncio.to_thread(
-        model.generate_content,
-        prompt,
-        generation_config={"response_mime_type": "application/json"},
-    )
+    # The first call imports the SDK; keep that off the event loop when warmup did not run.
+    model = await asyncio.to_thread(_get_model)
+    async with _llm_budget():
+        response = await asyncio.to_thread(
+            model.generate_content,
+            prompt,
+            generation_config={"response_mime_type": "application/json"},
+        )
     payload = _strip_code_fence(_extract_response_text(response))
     data = json.loads(payload)
     return ContactResponse.model_validate(data)
@@ -144,17 +233,147 @@ async def structure_contacts(ocr_text: str) -> ContactResponse:
     if not ocr_text.strip():
         return ContactResponse()
     prompt = f"{_STRUCTURE_PROMPT}{ocr_text}\n"
-    return await _invoke_model(prompt)
+    key = hashlib.sha256(f"{_MODEL_NAME}\n{prompt}".encode("utf-8")).hexdigest()
+    store = get_shared_store()
+    cached = await store.aget("llm_structure", key)
+    if cached is not None:
+        return ContactResponse.model_validate(cached)
+    result = await _invoke_model(prompt)
+    await store.aset("llm_structure", key, result.model_dump(mode="json"), get_settings().shared_cache_ttl_seconds)
+    return result
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) used for prompt size reporting."""
+    return (len(text) + 3) // 4
+
+
+def _drop_empty(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _drop_empty(item)
+            for key, item in value.items()
+            if item is not None and item != "" and item != {} and item != []
+        }
+    return value
+
+
+def _compact_contact(contact: dict[str, Any]) -> dict[str, Any]:
+    """Strip null/empty fields and rename known keys to their short form."""
+    return {_COMPACT_KEYS.get(key, key): value for key, value in _drop_empty(contact).items()}
+
+
+def _compact_json(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _chunk_contacts(
+    compact: list[dict[str, Any]],
+    max_items: int,
+    max_chars: int,
+) -> list[list[dict[str, Any]]]:
+    """Split contacts into consecutive chunks bounded by item count and serialized size."""
+    chunks: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    current_chars = 0
+    for contact in compact:
+        size = len(_compact_json(contact)) + 1
+        if current and (len(current) >= max_items or current_chars + size > max_chars):
+            chunks.append(current)
+            current, current_chars = [], 0
+        current.append(contact)
+        current_chars += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def contact_content_hash(contact: dict[str, Any], instructions: str | None = None) -> str:
+    """Stable hash of a contact's content plus the improve instructions and model."""
+    guidance = instructions.strip() if instructions else "None"
+    content = json.dumps(_compact_contact(contact), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(f"{_MODEL_NAME}\n{guidance}\n{content}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def _improve_chunk(
+    prompt: str,
+    expected: int,
+    semaphore: asyncio.Semaphore,
+    retries: int,
+) -> ContactResponse:
+    attempt = 0
+    while True:
+        try:
+            async with semaphore:
+                result = await _invoke_model(prompt)
+            if len(result.contacts) != expected:
+                raise ValueError(f"LLM returned {len(result.contacts)} contacts for a chunk of {expected}")
+            return result
+        except RuntimeError:
+            raise
+        except Exception as exc:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            logger.warning("Improve chunk failed (%s); retrying %d/%d", exc, attempt, retries)
 
 
 async def improve_contacts(
     contacts: list[dict[str, Any]],
     instructions: str | None = None,
-) -> ContactResponse:
-    contacts_json = json.dumps(contacts, ensure_ascii=False, indent=2)
+) -> ImproveResponse:
+    if not contacts:
+        return ImproveResponse()
+
+    settings = get_settings()
     guidance = instructions.strip() if instructions else "None"
-    prompt = _IMPROVE_PROMPT.format(contacts_json=contacts_json, instructions=guidance)
-    return await _invoke_model(prompt)
+    compact = [_compact_contact(contact) for contact in contacts]
+    chunks = _chunk_contacts(
+        compact,
+        max_items=max(settings.improve_chunk_size, 1),
+        max_chars=max(settings.improve_chunk_chars, 1),
+    )
+    prompts = [
+        _IMPROVE_PROMPT.format(contacts_json=_compact_json(chunk), instructions=guidance)
+        for chunk in chunks
+    ]
+
+    semaphore = asyncio.Semaphore(max(settings.improve_concurrency, 1))
+    tasks = [
+        asyncio.ensure_future(_improve_chunk(prompt, len(chunk), semaphore, settings.improve_max_retries))
+        for prompt, chunk in zip(prompts, chunks)
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # One chunk failing fails the request; stop the others instead of paying for discarded calls.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    legacy_prompt = _IMPROVE_PROMPT.format(
+        contacts_json=json.dumps(contacts, ensure_ascii=False, indent=2),
+        instructions=guidance,
+    )
+    tokens_before = _estimate_tokens(legacy_prompt)
+    tokens_after = sum(_estimate_tokens(prompt) for prompt in prompts)
+    logger.info(
+        "Improve prompt tokens (estimated): %d -> %d across %d chunk(s)",
+        tokens_before,
+        tokens_after,
+        len(prompts),
+    )
+
+    return ImproveResponse(
+        contacts=[contact for result in results for contact in result.contacts],
+        meta={
+            "chunks": len(prompts),
+            "prompt_tokens_before": tokens_before,
+            "prompt_tokens_after": tokens_after,
+        },
+    )
 
 
 _DEDUPE_PROMPT = """You are a contact deduplication expert. Analyze the contacts and merge ONLY true duplicates of the same person.
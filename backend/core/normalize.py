@@ -1,6 +1,14 @@
 import re
 
 _PHONE_PATTERN = re.compile(r"[+\d][\d\s().-]{6,}")
+_EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_WEBSITE_PATTERN = re.compile(r"\b(?:https?://|www\.)\S+", re.IGNORECASE)
+
+
+def count_contact_fields(text: str) -> int:
+    """Count phone, email and website matches in raw OCR text."""
+    phones = [match for match in _PHONE_PATTERN.findall(text) if len(re.sub(r"\D", "", match)) >= 7]
+    return len(phones) + len(_EMAIL_PATTERN.findall(text)) + len(_WEBSITE_PATTERN.findall(text))
 
 
 def normalize_phone(raw: str | None) -> str | None:
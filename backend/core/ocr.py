@@ -1,25 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import importlib
 from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
-from typing import Protocol, TypedDict
-
-from PIL import Image, UnidentifiedImageError
+from typing import Any, NotRequired, Protocol, TypedDict
 
 from backend.core.config import get_settings
+from backend.core.normalize import count_contact_fields
+from backend.core.shared_store import get_shared_store
+
 
-try:  # pragma: no cover - optional dependency guard
-    import pytesseract
-    from pytesseract import Output
-except ImportError:  # pragma: no cover
-    pytesseract = None  # type: ignore[assignment]
-    Output = None  # type: ignore[assignment]
+@lru_cache(maxsize=1)
+def _load_pytesseract() -> Any:
+    """Import pytesseract (and PIL with it) on first use to keep startup fast."""
+    try:  # pragma: no cover - optional dependency guard
+        return importlib.import_module("pytesseract")
+    except ImportError:  # pragma: no cover
+        return None
 
 
 class OcrResult(TypedDict):
     text: str
     confidence: float
+    ocr_pass: NotRequired[str]
+    variant: NotRequired[str]
 
 
 class OcrProvider(Protocol):
@@ -27,20 +34,52 @@ class OcrProvider(Protocol):
         """Return extracted text and a confidence score between 0 and 1."""
 
 
+def _parse_variant(spec: str) -> tuple[int, str]:
+    """Parse ``"<psm>[:<preprocess>]"`` into a page-segmentation mode and preprocessing name."""
+    psm, _, preprocess = spec.strip().partition(":")
+    return int(psm), preprocess or "none"
+
+
+def _preprocess(image: Any, name: str) -> Any:
+    from PIL import ImageFilter, ImageOps
+
+    if name == "none":
+        return image
+    gray = ImageOps.autocontrast(ImageOps.grayscale(image))
+    if name == "gray":
+        return gray
+    if name == "threshold":
+        return gray.point(lambda value: 255 if value > 128 else 0)
+    if name == "sharpen":
+        return gray.filter(ImageFilter.SHARPEN)
+    raise ValueError(f"Unknown OCR preprocessing step: {name}")
+
+
 @dataclass
 class TesseractProvider:
     lang: str = "eng"
     tesseract_cmd: str | None = None
+    cascade: bool = False
+    fast_max_side: int = 1200
+    fast_psm: int = 6
+    min_confidence: float = 0.75
+    min_fields: int = 2
+    variants: tuple[str, ...] = ("3", "11", "6:threshold")
 
     def __post_init__(self):
+        pytesseract = _load_pytesseract()
         if pytesseract is not None and self.tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = self.tesseract_cmd
 
     async def extract_text(self, image_bytes: bytes) -> OcrResult:
+        pytesseract = await asyncio.to_thread(_load_pytesseract)
         if pytesseract is None:
             raise RuntimeError("pytesseract is not installed. Install it or configure another OCR provider.")
+        from PIL import UnidentifiedImageError
 
         try:
+            if self.cascade:
+                return await self._extract_cascade(image_bytes)
             return await asyncio.to_thread(self._extract_sync, image_bytes)
         except pytesseract.TesseractNotFoundError as exc:  # type: ignore[attr-defined]
             raise RuntimeError(
@@ -49,31 +88,108 @@ class TesseractProvider:
         except UnidentifiedImageError as exc:
             raise ValueError("Unable to read image data. Ensure a valid image file is uploaded.") from exc
 
+    def version(self) -> str:
+        """Return the Tesseract binary version, raising if it cannot be run."""
+        pytesseract = _load_pytesseract()
+        if pytesseract is None:
+            raise RuntimeError("pytesseract is not installed. Install it or configure another OCR provider.")
+        return str(pytesseract.get_tesseract_version())
+
     def _extract_sync(self, image_bytes: bytes) -> OcrResult:
+        result = self._recognize(self._open(image_bytes), psm=None)
+        result["ocr_pass"] = "single"
+        return result
+
+    async def _extract_cascade(self, image_bytes: bytes) -> OcrResult:
+        """Cheap pass on a downscaled image; full-resolution variants in parallel only if it looks weak."""
+        image = await asyncio.to_thread(self._open, image_bytes)
+        fast = await asyncio.to_thread(self._run_fast, image)
+        fast["ocr_pass"] = "fast"
+        fast["variant"] = f"psm{self.fast_psm}:downscaled"
+        if fast["confidence"] >= self.min_confidence and count_contact_fields(fast["text"]) >= self.min_fields:
+            return fast
+
+        specs = [_parse_variant(spec) for spec in self.variants]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._run_variant, image, psm, preprocess) for psm, preprocess in specs)
+        )
+        for result, (psm, preprocess) in zip(results, specs):
+            result["variant"] = f"psm{psm}:{preprocess}"
+        # Prefer the variant that found the most contact fields, then the most confident one.
+        best = max([fast, *results], key=lambda result: (count_contact_fields(result["text"]), result["confidence"]))
+        # The pass reports how far the cascade went, even when the fast result still scored best.
+        return {**best, "ocr_pass": "full"}
+
+    def _open(self, image_bytes: bytes) -> Any:
+        from PIL import Image
+
         image = Image.open(BytesIO(image_bytes))
-        image = image.convert("RGB")
-        text = pytesseract.image_to_string(image, lang=self.lang)
+        return image.convert("RGB")
+
+    def _run_fast(self, image: Any) -> OcrResult:
+        small = image.copy()
+        small.thumbnail((self.fast_max_side, self.fast_max_side))
+        return self._recognize(small, psm=self.fast_psm)
+
+    def _run_variant(self, image: Any, psm: int, preprocess: str) -> OcrResult:
+        return self._recognize(_preprocess(image, preprocess), psm=psm)
+
+    def _recognize(self, image: Any, psm: int | None) -> OcrResult:
+        pytesseract = _load_pytesseract()
+        config = f"--psm {psm}" if psm is not None else ""
+        text = pytesseract.image_to_string(image, lang=self.lang, config=config)
         confidence = 0.0
 
-        if Output is not None:
-            data = pytesseract.image_to_data(image, lang=self.lang, output_type=Output.DICT)
-            confidences = [float(conf) for conf in data.get("conf", []) if conf not in {"-1", "-0"}]
-            if confidences:
-                # pytesseract reports confidence as percentage (0-100)
-                confidence = max(min(sum(confidences) / len(confidences) / 100.0, 1.0), 0.0)
+        data = pytesseract.image_to_data(image, lang=self.lang, config=config, output_type=pytesseract.Output.DICT)
+        confidences = [float(conf) for conf in data.get("conf", []) if conf not in {"-1", "-0"}]
+        if confidences:
+            # pytesseract reports confidence as percentage (0-100)
+            confidence = max(min(sum(confidences) / len(confidences) / 100.0, 1.0), 0.0)
 
         return {"text": text.strip(), "confidence": round(confidence, 4)}
 
 
+async def warmup_ocr() -> str | None:
+    """Import the OCR stack and probe the Tesseract binary ahead of the first request."""
+    settings = get_settings()
+    if settings.ocr_provider != "tesseract":
+        return None
+    # Import pytesseract/PIL off the event loop; /health keeps answering meanwhile.
+    await asyncio.to_thread(_load_pytesseract)
+    provider = TesseractProvider(lang=settings.tesseract_lang, tesseract_cmd=settings.tesseract_cmd)
+    return await asyncio.to_thread(provider.version)
+
+
 async def run_ocr(image_bytes: bytes) -> OcrResult:
     settings = get_settings()
+    store = get_shared_store()
+    mode = "single"
+    if settings.ocr_cascade:
+        mode = (
+            f"cascade:{settings.ocr_fast_psm}:{settings.ocr_fast_max_side}:{settings.ocr_cascade_min_confidence}:"
+            f"{settings.ocr_cascade_min_fields}:{settings.ocr_cascade_variants}"
+        )
+    key = f"{settings.ocr_provider}:{settings.tesseract_lang}:{mode}:{hashlib.sha256(image_bytes).hexdigest()}"
+    cached = await store.aget("ocr", key)
+    if cached is not None:
+        return cached
 
     if settings.ocr_provider == "tesseract":
+        # Import pytesseract/PIL off the event loop in case warmup did not run.
+        await asyncio.to_thread(_load_pytesseract)
         provider: OcrProvider = TesseractProvider(
             lang=settings.tesseract_lang,
             tesseract_cmd=settings.tesseract_cmd,
+            cascade=settings.ocr_cascade,
+            fast_max_side=settings.ocr_fast_max_side,
+            fast_psm=settings.ocr_fast_psm,
+            min_confidence=settings.ocr_cascade_min_confidence,
+            min_fields=settings.ocr_cascade_min_fields,
+            variants=tuple(spec for spec in settings.ocr_cascade_variants.split(",") if spec.strip()),
         )
     else:
         raise ValueError(f"Unsupported OCR provider: {settings.ocr_provider}")
 
-    return await provider.extract_text(image_bytes)
+    result = await provider.extract_text(image_bytes)
+    await store.aset("ocr", key, result, settings.shared_cache_ttl_seconds)
+    return result
@@ -0,0 +1,278 @@
+"""
+Opt-in request profiling: stage timings, SQL timings, sampled stacks, and slow-request capture.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import itertools
+import random
+import sys
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterator
+
+from backend.core.config import get_settings
+
+PROFILE_HEADER = "x-profile"
+
+_ids = itertools.count(1)
+_current: ContextVar["RequestProfile | None"] = ContextVar("request_profile", default=None)
+_captured: deque[dict[str, Any]] = deque(maxlen=get_settings().profile_max_entries)
+_sql_stats: dict[str, dict[str, float]] = {}
+_sql_lock = threading.Lock()
+
+
+@dataclass
+class RequestProfile:
+    method: str
+    path: str
+    sampled: bool = False
+    started: float = field(default_factory=time.perf_counter)
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    stages: list[dict[str, Any]] = field(default_factory=list)
+    sql: list[dict[str, Any]] = field(default_factory=list)
+    sql_dropped: int = 0
+    await_stack: list[str] = field(default_factory=list)
+    sampler: "StackSampler | None" = None
+    streaming: bool = False
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+
+class StackSampler:
+    """Background thread that periodically samples Python stacks while a request runs.
+
+    Event-loop samples are attributed to the request only while its task, or a task it spawned,
+    is the one running (scope ``request``). Other threads, such as ``to_thread`` workers, may be
+    serving any concurrent request, so their samples are labelled ``process``.
+    """
+
+    def __init__(self, interval_seconds: float, task: asyncio.Task | None = None):
+        self.interval_seconds = interval_seconds
+        self.tasks: weakref.WeakSet[asyncio.Task] = weakref.WeakSet()
+        if task is not None:
+            self.tasks.add(task)
+        self.loop = task.get_loop() if task is not None else None
+        self.loop_thread_id = threading.get_ident()
+        self.samples: Counter[tuple[str, str]] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> list[dict[str, Any]]:
+        self._stop.set()
+        self._thread.join()
+        return [
+            {"scope": scope, "stack": stack, "samples": count}
+            for (scope, stack), count in self.samples.most_common(30)
+        ]
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval_seconds):
+            for thread in threading.enumerate():
+                names[thread.ident] = thread.name
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if thread_id == self.loop_thread_id:
+                    if self.loop is None or asyncio.current_task(self.loop) not in self.tasks:
+                        continue
+                    scope = "request"
+                else:
+                    scope = "process"
+                stack = []
+                while frame is not None:
+                    stack.append(f"{frame.f_code.co_name} ({frame.f_code.co_filename}:{frame.f_lineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[(scope, ";".join(reversed(stack)))] += 1
+
+
+def _task_factory(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Task:
+    """Create tasks as usual, tracking those spawned by a sampled request for stack attribution."""
+    task = asyncio.Task(coro, loop=loop, **kwargs)
+    profile = _current.get()
+    if profile is not None and profile.sampler is not None:
+        profile.sampler.tasks.add(task)
+    return task
+
+
+def should_sample(headers: dict[str, str]) -> bool:
+    """Sample when the admin token is sent in the profile header, or for a random fraction of requests."""
+    settings = get_settings()
+    token = headers.get(PROFILE_HEADER)
+    if token and settings.profile_admin_token and hmac.compare_digest(token.encode(), settings.profile_admin_token.encode()):
+        return True
+    return settings.profile_sample_rate > 0 and random.random() < settings.profile_sample_rate
+
+
+def begin_request(
+    method: str, path: str, sampled: bool, task: asyncio.Task | None = None
+) -> tuple[RequestProfile, Any]:
+    """Start profiling a request; must be called on the event loop thread running ``task``."""
+    profile = RequestProfile(method=method, path=path, sampled=sampled)
+    if sampled:
+        profile.sampler = StackSampler(get_settings().profile_sample_interval_ms / 1000, task)
+        profile.sampler.start()
+    return profile, _current.set(profile)
+
+
+def end_request(profile: RequestProfile, token: Any, status_code: int | None) -> None:
+    _current.reset(token)
+    samples = profile.sampler.stop() if profile.sampler is not None else []
+    duration_ms = profile.elapsed_ms()
+    slow_ms = get_settings().slow_request_ms
+    # Long-lived event streams are slow by design and are only captured when sampled.
+    slow = slow_ms > 0 and duration_ms >= slow_ms and not profile.streaming
+    if not (profile.sampled or slow):
+        return
+    _captured.append(
+        {
+            "id": next(_ids),
+            "method": profile.method,
+            "path": profile.path,
+            "status_code": status_code,
+            "started_at": profile.started_at.isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "reason": "sampled" if profile.sampled else "slow",
+            "stages": profile.stages,
+            "sql": profile.sql,
+            "sql_dropped": profile.sql_dropped,
+            "await_stack": profile.await_stack,
+            "samples": samples,
+        }
+    )
+
+
+def capture_await_stack(profile: RequestProfile, task: asyncio.Task) -> None:
+    """Record where a still-running request task is currently awaiting."""
+    stack = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            stack.append(repr(awaitable))
+            break
+        stack.append(f"{frame.f_code.co_name} ({frame.f_code.co_filename}:{frame.f_lineno})")
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    profile.await_stack = stack
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a named stage of the current request (no-op outside a profiled request)."""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    offset_ms = profile.elapsed_ms()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.stages.append(
+            {
+                "name": name,
+                "offset_ms": round(offset_ms, 2),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            }
+        )
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """SQLAlchemy hook: aggregate statement timings and attach them to the current request."""
+    started = conn.info["query_started"].pop()
+    duration_ms = (time.perf_counter() - started) * 1000
+    key = " ".join(statement.split())[:300]
+    with _sql_lock:
+        stats = _sql_stats.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += duration_ms
+        stats["max_ms"] = max(stats["max_ms"], duration_ms)
+    profile = _current.get()
+    # Event streams poll for as long as the client stays connected; only their setup is recorded.
+    if profile is None or profile.streaming:
+        return
+    if len(profile.sql) < get_settings().profile_max_sql_entries:
+        profile.sql.append({"statement": key, "duration_ms": round(duration_ms, 3)})
+    else:
+        profile.sql_dropped += 1
+
+
+def captured_profiles() -> list[dict[str, Any]]:
+    return list(_captured)
+
+
+def sql_statistics(limit: int = 50) -> list[dict[str, Any]]:
+    with _sql_lock:
+        rows = [
+            {
+                "statement": statement,
+                "count": int(stats["count"]),
+                "total_ms": round(stats["total_ms"], 2),
+                "mean_ms": round(stats["total_ms"] / stats["count"], 3),
+                "max_ms": round(stats["max_ms"], 3),
+            }
+            for statement, stats in _sql_stats.items()
+        ]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows[:limit]
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles HTTP requests and captures sampled or slow ones."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        task = asyncio.current_task()
+        sampled = should_sample(headers)
+        loop = asyncio.get_running_loop()
+        if sampled and loop.get_task_factory() is None:
+            loop.set_task_factory(_task_factory)
+        profile, token = begin_request(scope["method"], scope["path"], sampled, task)
+        status: dict[str, int] = {}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                profile.streaming = content_type.startswith(b"text/event-stream")
+            await send(message)
+
+        slow_ms = get_settings().slow_request_ms
+        watchdog = None
+        if slow_ms > 0 and task is not None:
+            watchdog = asyncio.get_running_loop().call_later(
+                slow_ms / 1000, capture_await_stack, profile, task
+            )
+        try:
+            with stage("total"):
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            end_request(profile, token, status.get("code"))
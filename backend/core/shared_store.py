@@ -0,0 +1,179 @@
+"""
+SQLite-backed store shared by every worker process on the host: result cache, leases, and rate buckets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+
+from backend.core.config import get_settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS ix_cache_expires_at ON cache (expires_at);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT NOT NULL,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (name, holder)
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SharedStore:
+    """Cross-process cache, counting leases, and token buckets in one SQLite file.
+
+    Methods are blocking; the ``a``-prefixed variants run them in a worker thread.
+    """
+
+    def __init__(self, path: str, busy_timeout_seconds: float = 10.0, prune_interval_seconds: float = 60.0):
+        self.path = path
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self.prune_interval_seconds = prune_interval_seconds
+        self._local = threading.local()
+        self._last_prune = 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_seconds, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        row = self._connection().execute(
+            "SELECT value FROM cache WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, key, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> None:
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), now + ttl_seconds),
+        )
+        # Expired rows are never returned by get(); dropping them is housekeeping, so do it occasionally.
+        if now - self._last_prune >= self.prune_interval_seconds:
+            self._last_prune = now
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+
+    def set_if_absent(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> Any:
+        """Store ``value`` unless a live entry exists; return whichever value is stored afterwards."""
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ? AND expires_at <= ?", (namespace, key, now)
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), now + ttl_seconds),
+            )
+            (stored,) = conn.execute(
+                "SELECT value FROM cache WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            conn.execute("COMMIT")
+            return json.loads(stored)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._connection().execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def try_acquire(self, name: str, holder: str, limit: int, ttl_seconds: float) -> bool:
+        """Take one of ``limit`` slots for ``name``; expired leases from crashed workers are reclaimed."""
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM leases WHERE name = ? AND expires_at <= ?", (name, now))
+            (active,) = conn.execute("SELECT count(*) FROM leases WHERE name = ?", (name,)).fetchone()
+            if active >= limit:
+                conn.execute("COMMIT")
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (name, holder, expires_at) VALUES (?, ?, ?)",
+                (name, holder, now + ttl_seconds),
+            )
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def release(self, name: str, holder: str) -> None:
+        self._connection().execute("DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder))
+
+    def take_token(self, name: str, rate_per_second: float, capacity: float) -> float:
+        """Consume one token from a shared bucket; return 0 if granted, else seconds to wait."""
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE name = ?", (name,)).fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + (now - row[1]) * rate_per_second)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate_per_second
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (name, tokens, now),
+            )
+            conn.execute("COMMIT")
+            return wait
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    async def aget(self, namespace: str, key: str) -> Any | None:
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def aset(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> None:
+        await asyncio.to_thread(self.set, namespace, key, value, ttl_seconds)
+
+    async def aset_if_absent(self, namespace: str, key: str, value: Any, ttl_seconds: float) -> Any:
+        return await asyncio.to_thread(self.set_if_absent, namespace, key, value, ttl_seconds)
+
+    async def adelete(self, namespace: str, key: str) -> None:
+        await asyncio.to_thread(self.delete, namespace, key)
+
+    async def atry_acquire(self, name: str, holder: str, limit: int, ttl_seconds: float) -> bool:
+        return await asyncio.to_thread(self.try_acquire, name, holder, limit, ttl_seconds)
+
+    async def arelease(self, name: str, holder: str) -> None:
+        await asyncio.to_thread(self.release, name, holder)
+
+    async def atake_token(self, name: str, rate_per_second: float, capacity: float) -> float:
+        return await asyncio.to_thread(self.take_token, name, rate_per_second, capacity)
+
+
+@lru_cache(maxsize=1)
+def get_shared_store() -> SharedStore:
+    """Return the process-wide handle to the host-wide shared store."""
+    return SharedStore(get_settings().shared_store_path)
@@ -2,9 +2,12 @@
 Database connection and session management.
 """
 
+from sqlalchemy import event, text
+from sqlalchemy.schema import CreateColumn, CreateIndex
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from backend.core.profiling import after_cursor_execute, before_cursor_execute
 from backend.database.models import Base
 
 DATABASE_URL = "sqlite+aiosqlite:///./contacts.db"
@@ -12,19 +15,73 @@ DATABASE_URL = "sqlite+aiosqlite:///./contacts.db"
 engine = create_async_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    # aiosqlite defaults to NullPool for files; reuse connections so pragmas run once per connection.
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
     echo=False,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Per-connection pragmas so several worker processes can share the database file."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+# Statement timings feed the profiling admin endpoints and per-request profiles.
+event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
 async_session_maker = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
+def _add_generated_columns(sync_conn):
+    """Add generated columns missing from tables created by older versions."""
+    for table in Base.metadata.sorted_tables:
+        existing = {row[1] for row in sync_conn.exec_driver_sql(f"PRAGMA table_xinfo({table.name})")}
+        missing = [column for column in table.columns if column.computed is not None and column.name not in existing]
+        for column in missing:
+            ddl = CreateColumn(column).compile(dialect=sync_conn.dialect)
+            sync_conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+
+
+def _create_missing_indexes(sync_conn):
+    """Create indexes added to tables that already exist (create_all skips existing tables)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            sync_conn.execute(CreateIndex(index, if_not_exists=True))
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_generated_columns)
+        await conn.run_sync(_create_missing_indexes)
+        # Created by older versions; substring job title filters never used it.
+        await conn.execute(text("DROP INDEX IF EXISTS ix_contacts_job_title"))
+
+
+async def configure_db():
+    """Switch the database file to WAL so readers in every worker run alongside a writer.
+
+    The journal mode is persistent in the file; the remaining pragmas are set per connection.
+    """
+    async with engine.begin() as conn:
+        await conn.execute(text("PRAGMA journal_mode=WAL"))
+
+
+async def warmup_db():
+    """Open a pooled connection ahead of the first request."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
 
 async def get_db():
@@ -5,11 +5,26 @@ Database models for contact storage.
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Index
+from sqlalchemy import Column, Computed, Integer, String, Float, DateTime, JSON, Index, ForeignKey, UniqueConstraint, func
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+# Generated columns exposing commonly inferred ``extra`` keys (lowercased) for indexed filtering,
+# mapped to the ``extra`` key each one reads.
+EXTRA_COLUMN_KEYS = {
+    "job_title": "job_title",
+    "department": "department",
+    "industry": "inferred_industry",
+    "website": "website",
+    "address": "address",
+}
+EXTRA_COLUMNS = tuple(EXTRA_COLUMN_KEYS)
+
+
+def _extra_value(key: str) -> Computed:
+    return Computed(f"lower(trim(json_extract(extra, '$.{key}')))", persisted=False)
+
 
 class Contact(Base):
     __tablename__ = "contacts"
@@ -25,10 +40,18 @@ class Contact(Base):
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Filtered by substring (LIKE '%...%'), which cannot use an index, so none is kept.
+    job_title = Column(String, _extra_value(EXTRA_COLUMN_KEYS["job_title"]))
+    department = Column(String, _extra_value(EXTRA_COLUMN_KEYS["department"]), index=True)
+    industry = Column(String, _extra_value(EXTRA_COLUMN_KEYS["industry"]), index=True)
+    website = Column(String, _extra_value(EXTRA_COLUMN_KEYS["website"]), index=True)
+    address = Column(String, _extra_value(EXTRA_COLUMN_KEYS["address"]))
+
     # Composite indexes for common queries
     __table_args__ = (
         Index('ix_name_company', 'name', 'company'),
         Index('ix_email_phone', 'email', 'phone'),
+        Index('ix_company_lower', func.lower(func.trim(company))),
     )
 
     def to_dict(self) -> dict[str, Any]:
@@ -44,3 +67,87 @@ class Contact(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+class ContactNameKey(Base):
+    """Fuzzy name index: one row per trigram/phonetic key of a contact's name."""
+
+    __tablename__ = "contact_name_keys"
+
+    contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), primary_key=True)
+    key = Column(String, primary_key=True)
+
+    __table_args__ = (
+        Index('ix_contact_name_keys_key', 'key', 'contact_id'),
+    )
+
+
+class ContactFacet(Base):
+    """Running count of contacts per facet value, maintained on every write."""
+
+    __tablename__ = "contact_facets"
+
+    facet = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class ContactChange(Base):
+    """Append-only change log; ``seq`` is monotonic and deletes are kept as tombstones."""
+
+    __tablename__ = "contact_changes"
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    contact_id = Column(Integer, nullable=False, index=True)
+    op = Column(String, nullable=False)
+    changed_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = {"sqlite_autoincrement": True}
+
+
+class DedupeBlock(Base):
+    """Blocking index for the duplicate scanner: contacts sharing a key are compared."""
+
+    __tablename__ = "dedupe_blocks"
+
+    block_key = Column(String, primary_key=True)
+    contact_id = Column(Integer, primary_key=True, index=True)
+
+
+class MergeCandidate(Base):
+    """Scored pair of stored contacts that may be the same person (``contact_a < contact_b``)."""
+
+    __tablename__ = "merge_candidates"
+
+    id = Column(Integer, primary_key=True)
+    contact_a = Column(Integer, nullable=False, index=True)
+    contact_b = Column(Integer, nullable=False, index=True)
+    score = Column(Float, nullable=False)
+    reasons = Column(JSON, nullable=True)
+    status = Column(String, nullable=False, default="pending")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('contact_a', 'contact_b', name='uq_merge_candidate_pair'),
+        Index('ix_merge_candidates_status_score', 'status', 'score'),
+    )
+
+
+class ScanCheckpoint(Base):
+    """Last change sequence processed by a background scanner."""
+
+    __tablename__ = "scan_checkpoints"
+
+    name = Column(String, primary_key=True)
+    seq = Column(Integer, nullable=False, default=0)
+
+
+class ImprovedContact(Base):
+    """Improve results keyed by the content hash of the contact that produced them."""
+
+    __tablename__ = "improved_contacts"
+
+    content_hash = Column(String, primary_key=True)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
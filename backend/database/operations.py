@@ -2,18 +2,122 @@
 Database operations for contacts.
 """
 
+import json
+from collections import Counter
+from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select, or_, func
+from sqlalchemy import delete, literal, select, or_, func, union_all, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.database.models import Contact
+from backend.core.fuzzy import name_keys, name_similarity
+from backend.database.models import (
+    EXTRA_COLUMN_KEYS,
+    EXTRA_COLUMNS,
+    Contact,
+    ContactChange,
+    ContactFacet,
+    ContactNameKey,
+    DedupeBlock,
+    ImprovedContact,
+    MergeCandidate,
+    ScanCheckpoint,
+)
+
+FACETS = ("company", "industry", "department")
+# Generated columns matched by substring rather than exact (normalized) value.
+_SUBSTRING_FILTERS = {"job_title", "address"}
+
+
+async def _index_contact_name(db: AsyncSession, contact: Contact) -> None:
+    """Replace the fuzzy name index entries for a contact."""
+    await db.execute(delete(ContactNameKey).where(ContactNameKey.contact_id == contact.id))
+    db.add_all(ContactNameKey(contact_id=contact.id, key=key) for key in name_keys(contact.name))
+
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _sqlite_text(value: Any) -> str | None:
+    """Text SQLite produces for a JSON value read with ``json_extract`` and passed to ``trim``."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        # SQLite renders REAL values with "%!.15g": always a decimal point, e.g. 5.0 or 1.0e+20.
+        text = f"{value:.15g}"
+        if "." not in text and "n" not in text:
+            mantissa, e, exponent = text.partition("e")
+            text = f"{mantissa}.0{e}{exponent}"
+        return text
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return str(value)
+
+
+def _normalize_facet(value: Any) -> str | None:
+    """Mirror SQLite's ``lower(trim(...))``: strip spaces only and fold ASCII letters only."""
+    text = _sqlite_text(value)
+    if text is None:
+        return None
+    text = text.strip(" ").translate(_ASCII_LOWER)
+    return text or None
+
+
+def _facet_values(company: str | None, extra: Any) -> dict[str, str]:
+    """Facet values of a contact, normalized the same way as the generated columns."""
+    extra = extra if isinstance(extra, dict) else {}
+    values = {
+        "company": _normalize_facet(company),
+        "industry": _normalize_facet(extra.get("inferred_industry")),
+        "department": _normalize_facet(extra.get("department")),
+    }
+    return {facet: value for facet, value in values.items() if value is not None}
+
+
+async def _adjust_facets(db: AsyncSession, old: dict[str, str], new: dict[str, str]) -> None:
+    """Apply the difference between two facet value sets to the running counts."""
+    deltas: dict[tuple[str, str], int] = {}
+    for facet, value in old.items():
+        deltas[(facet, value)] = deltas.get((facet, value), 0) - 1
+    for facet, value in new.items():
+        deltas[(facet, value)] = deltas.get((facet, value), 0) + 1
+    rows = [
+        {"facet": facet, "value": value, "count": delta}
+        for (facet, value), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(ContactFacet).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ContactFacet.facet, ContactFacet.value],
+        set_={"count": ContactFacet.count + stmt.excluded["count"]},
+    )
+    await db.execute(stmt)
+    await db.execute(delete(ContactFacet).where(ContactFacet.count <= 0))
+
+
+def _record_change(db: AsyncSession, contact_id: int, op: str) -> None:
+    db.add(ContactChange(contact_id=contact_id, op=op))
 
 
 async def create_contact(db: AsyncSession, contact_data: dict[str, Any]) -> Contact:
     """Create a new contact in the database."""
-    contact = Contact(**contact_data)
+    contact = Contact(
+        **{
+            key: value
+            for key, value in contact_data.items()
+            if key in Contact.__table__.columns and key not in EXTRA_COLUMNS
+        }
+    )
     db.add(contact)
+    await db.flush()
+    await _index_contact_name(db, contact)
+    await _adjust_facets(db, {}, _facet_values(contact.company, contact.extra))
+    _record_change(db, contact.id, "create")
     await db.commit()
     await db.refresh(contact)
     return contact
@@ -25,6 +129,48 @@ async def get_contact_by_id(db: AsyncSession, contact_id: int) -> Contact | None
     return result.scalar_one_or_none()
 
 
+CONTACT_FIELDS = (
+    "id",
+    "name",
+    "phone",
+    "email",
+    "company",
+    "notes",
+    "confidence",
+    "extra",
+    "created_at",
+    "updated_at",
+)
+SUMMARY_FIELDS = tuple(field for field in CONTACT_FIELDS if field not in {"notes", "extra"})
+PROJECTABLE_FIELDS = CONTACT_FIELDS + EXTRA_COLUMNS
+
+
+def _search_filter(query: str):
+    search_pattern = f"%{query}%"
+    return or_(
+        Contact.name.ilike(search_pattern),
+        Contact.email.ilike(search_pattern),
+        Contact.phone.ilike(search_pattern),
+        Contact.company.ilike(search_pattern),
+    )
+
+
+def _extra_filters(filters: dict[str, str] | None) -> list:
+    """Conditions on the indexed generated columns (and normalized company)."""
+    conditions = []
+    for field, raw in (filters or {}).items():
+        value = _normalize_facet(raw)
+        if value is None:
+            continue
+        if field == "company":
+            conditions.append(func.lower(func.trim(Contact.company)) == value)
+        elif field in _SUBSTRING_FILTERS:
+            conditions.append(getattr(Contact, field).contains(value, autoescape=True))
+        elif field in EXTRA_COLUMNS:
+            conditions.append(getattr(Contact, field) == value)
+    return conditions
+
+
 async def search_contacts(
     db: AsyncSession,
     query: str | None = None,
@@ -35,15 +181,7 @@ async def search_contacts(
     stmt = select(Contact)
     
     if query:
-        search_pattern = f"%{query}%"
-        stmt = stmt.where(
-            or_(
-                Contact.name.ilike(search_pattern),
-                Contact.email.ilike(search_pattern),
-                Contact.phone.ilike(search_pattern),
-                Contact.company.ilike(search_pattern),
-            )
-        )
+        stmt = stmt.where(_search_filter(query))
     
     stmt = stmt.order_by(Contact.created_at.desc()).limit(limit).offset(offset)
     result = await db.execute(stmt)
@@ -61,6 +199,36 @@ async def get_all_contacts(
     return list(result.scalars().all())
 
 
+def _projected_column(field: str):
+    if field in EXTRA_COLUMN_KEYS:
+        return func.json_extract(Contact.extra, f"$.{EXTRA_COLUMN_KEYS[field]}").label(field)
+    return getattr(Contact, field)
+
+
+async def list_contact_rows(
+    db: AsyncSession,
+    fields: tuple[str, ...] = CONTACT_FIELDS,
+    query: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    filters: dict[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """List contacts as plain rows containing only the requested columns.
+
+    Skips ORM entity hydration; ``fields`` must be a subset of ``PROJECTABLE_FIELDS``. Extra
+    columns return the value as stored in ``extra``, not the normalized generated column.
+    """
+    stmt = select(*(_projected_column(field) for field in fields))
+
+    if query:
+        stmt = stmt.where(_search_filter(query))
+    stmt = stmt.where(*_extra_filters(filters))
+
+    stmt = stmt.order_by(Contact.created_at.desc()).limit(limit).offset(offset)
+    result = await db.execute(stmt)
+    return [dict(row) for row in result.mappings().all()]
+
+
 async def get_contact_by_name(db: AsyncSession, name: str) -> list[Contact]:
     """Get all contacts matching the name (case-insensitive)."""
     stmt = select(Contact).where(Contact.name.ilike(f"%{name}%"))
@@ -68,6 +236,64 @@ async def get_contact_by_name(db: AsyncSession, name: str) -> list[Contact]:
     return list(result.scalars().all())
 
 
+async def fuzzy_search_by_name(
+    db: AsyncSession,
+    name: str,
+    threshold: float = 0.5,
+    limit: int = 20,
+    max_key_frequency: int = 500,
+) -> list[tuple[Contact, float]]:
+    """Typo-tolerant name search ranked by similarity.
+
+    Candidates come from the indexed name key table, so only contacts sharing at least one
+    trigram or phonetic key with the query are scored. Each key reads at most
+    ``max_key_frequency + 1`` postings; keys more frequent than that (common leading trigrams,
+    popular Soundex codes) are ignored unless no rarer key exists, so the work is bounded by the
+    query rather than the table size.
+    """
+    keys = sorted(name_keys(name))
+    if not keys:
+        return []
+
+    per_key = []
+    for key in keys:
+        postings = (
+            select(ContactNameKey.contact_id)
+            .where(ContactNameKey.key == key)
+            .limit(max_key_frequency + 1)
+            .subquery()
+        )
+        per_key.append(select(literal(key).label("key"), postings.c.contact_id))
+    result = await db.execute(union_all(*per_key))
+    postings_by_key: dict[str, list[int]] = {}
+    for key, contact_id in result.all():
+        postings_by_key.setdefault(key, []).append(contact_id)
+
+    rare = [ids for ids in postings_by_key.values() if len(ids) <= max_key_frequency]
+    hits = Counter(contact_id for ids in (rare or postings_by_key.values()) for contact_id in ids)
+    candidates = [contact_id for contact_id, _ in hits.most_common(max(limit * 10, 100))]
+    if not candidates:
+        return []
+
+    result = await db.execute(select(Contact).where(Contact.id.in_(candidates)))
+    scored = [(contact, name_similarity(name, contact.name)) for contact in result.scalars().all()]
+    scored = [item for item in scored if item[1] >= threshold]
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:limit]
+
+
+async def backfill_name_keys(db: AsyncSession) -> int:
+    """Index names of contacts that have no fuzzy name keys yet (e.g. rows predating the index)."""
+    indexed = select(ContactNameKey.contact_id)
+    stmt = select(Contact).where(Contact.name.is_not(None), Contact.id.not_in(indexed))
+    result = await db.execute(stmt)
+    contacts = list(result.scalars().all())
+    for contact in contacts:
+        await _index_contact_name(db, contact)
+    await db.commit()
+    return len(contacts)
+
+
 async def update_contact(
     db: AsyncSession,
     contact_id: int,
@@ -78,9 +304,14 @@ async def update_contact(
     if not contact:
         return None
     
+    old_facets = _facet_values(contact.company, contact.extra)
     for key, value in contact_data.items():
-        if hasattr(contact, key):
+        if hasattr(contact, key) and key not in EXTRA_COLUMNS:
             setattr(contact, key, value)
+    if "name" in contact_data:
+        await _index_contact_name(db, contact)
+    await _adjust_facets(db, old_facets, _facet_values(contact.company, contact.extra))
+    _record_change(db, contact.id, "update")
     
     await db.commit()
     await db.refresh(contact)
@@ -93,25 +324,296 @@ async def delete_contact(db: AsyncSession, contact_id: int) -> bool:
     if not contact:
         return False
     
+    await db.execute(delete(ContactNameKey).where(ContactNameKey.contact_id == contact_id))
+    await _adjust_facets(db, _facet_values(contact.company, contact.extra), {})
+    _record_change(db, contact_id, "delete")
     await db.delete(contact)
     await db.commit()
     return True
 
 
-async def get_contact_count(db: AsyncSession, query: str | None = None) -> int:
+async def get_contact_count(
+    db: AsyncSession,
+    query: str | None = None,
+    filters: dict[str, str] | None = None,
+) -> int:
     """Get total count of contacts matching query."""
     stmt = select(func.count(Contact.id))
     
     if query:
-        search_pattern = f"%{query}%"
-        stmt = stmt.where(
-            or_(
-                Contact.name.ilike(search_pattern),
-                Contact.email.ilike(search_pattern),
-                Contact.phone.ilike(search_pattern),
-                Contact.company.ilike(search_pattern),
-            )
-        )
+        stmt = stmt.where(_search_filter(query))
+    stmt = stmt.where(*_extra_filters(filters))
     
     result = await db.execute(stmt)
     return result.scalar() or 0
+
+
+async def get_latest_change_seq(db: AsyncSession) -> int:
+    """Sequence number of the most recent contact change (0 if none)."""
+    result = await db.execute(select(func.max(ContactChange.seq)))
+    return result.scalar() or 0
+
+
+async def get_changes_since(
+    db: AsyncSession,
+    since: int = 0,
+    limit: int = 500,
+) -> tuple[list[dict[str, Any]], int, bool]:
+    """Contact changes after ``since``, collapsed to the latest change per contact.
+
+    Returns ``(changes, last_seq, has_more)``; pass ``last_seq`` as the next ``since``.
+    Deleted contacts (and contacts that no longer exist) are returned as tombstones, and a
+    contact created and then updated within the window is still reported as a create.
+    """
+    stmt = select(ContactChange).where(ContactChange.seq > since).order_by(ContactChange.seq).limit(limit + 1)
+    result = await db.execute(stmt)
+    rows = list(result.scalars().all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if not rows:
+        return [], since, False
+
+    latest: dict[int, ContactChange] = {}
+    created: set[int] = set()
+    for row in rows:
+        latest[row.contact_id] = row
+        if row.op == "create":
+            created.add(row.contact_id)
+
+    live_ids = [contact_id for contact_id, row in latest.items() if row.op != "delete"]
+    contacts: dict[int, Contact] = {}
+    if live_ids:
+        found = await db.execute(select(Contact).where(Contact.id.in_(live_ids)))
+        contacts = {contact.id: contact for contact in found.scalars().all()}
+
+    changes = []
+    for row in sorted(latest.values(), key=lambda change: change.seq):
+        contact = contacts.get(row.contact_id)
+        if contact is None:
+            op = "delete"
+        elif row.contact_id in created:
+            op = "create"
+        else:
+            op = row.op
+        changes.append(
+            {
+                "seq": row.seq,
+                "op": op,
+                "id": row.contact_id,
+                "contact": contact.to_dict() if contact is not None else None,
+            }
+        )
+    return changes, rows[-1].seq, has_more
+
+
+async def get_facet_counts(db: AsyncSession, limit: int = 20) -> dict[str, list[dict[str, Any]]]:
+    """Top facet values with their contact counts, read from the maintained counts table."""
+    facets: dict[str, list[dict[str, Any]]] = {}
+    for facet in FACETS:
+        stmt = (
+            select(ContactFacet.value, ContactFacet.count)
+            .where(ContactFacet.facet == facet)
+            .order_by(ContactFacet.count.desc(), ContactFacet.value)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        facets[facet] = [dict(row) for row in result.mappings().all()]
+    return facets
+
+
+async def backfill_facets(db: AsyncSession) -> None:
+    """Build facet counts from existing rows when the counts table has never been populated."""
+    populated = await db.execute(select(ContactFacet.facet).limit(1))
+    if populated.first() is not None:
+        return
+    result = await db.execute(select(Contact.company, Contact.extra))
+    counts: dict[tuple[str, str], int] = {}
+    for company, extra in result.all():
+        for facet, value in _facet_values(company, extra).items():
+            counts[(facet, value)] = counts.get((facet, value), 0) + 1
+    db.add_all(
+        ContactFacet(facet=facet, value=value, count=count) for (facet, value), count in counts.items()
+    )
+    await db.commit()
+
+
+async def get_improved_contacts(
+    db: AsyncSession,
+    hashes: set[str],
+    max_age_seconds: float | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Get stored improve results for the given content hashes, skipping expired entries."""
+    if not hashes:
+        return {}
+    stmt = select(ImprovedContact).where(ImprovedContact.content_hash.in_(hashes))
+    if max_age_seconds is not None:
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds)
+        stmt = stmt.where(ImprovedContact.created_at >= cutoff)
+    result = await db.execute(stmt)
+    return {row.content_hash: row.result for row in result.scalars().all()}
+
+
+async def save_improved_contacts(db: AsyncSession, entries: dict[str, dict[str, Any]]) -> None:
+    """Store improve results, replacing (and re-dating) any existing entry for the same hash."""
+    if not entries:
+        return
+    now = datetime.utcnow()
+    stmt = sqlite_insert(ImprovedContact).values(
+        [{"content_hash": key, "result": value, "created_at": now} for key, value in entries.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ImprovedContact.content_hash],
+        set_={"result": stmt.excluded.result, "created_at": stmt.excluded.created_at},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def prune_improved_contacts(db: AsyncSession, max_age_seconds: float) -> int:
+    """Delete stored improve results older than ``max_age_seconds``; returns the number removed."""
+    cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds)
+    result = await db.execute(delete(ImprovedContact).where(ImprovedContact.created_at < cutoff))
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def get_checkpoint(db: AsyncSession, name: str) -> int | None:
+    """Last processed change sequence for a scanner, or None if it has never run."""
+    result = await db.execute(select(ScanCheckpoint.seq).where(ScanCheckpoint.name == name))
+    return result.scalar_one_or_none()
+
+
+async def set_checkpoint(db: AsyncSession, name: str, seq: int) -> None:
+    stmt = sqlite_insert(ScanCheckpoint).values(name=name, seq=seq)
+    stmt = stmt.on_conflict_do_update(index_elements=[ScanCheckpoint.name], set_={"seq": stmt.excluded.seq})
+    await db.execute(stmt)
+
+
+async def get_contacts_by_ids(db: AsyncSession, contact_ids: set[int]) -> dict[int, Contact]:
+    if not contact_ids:
+        return {}
+    result = await db.execute(select(Contact).where(Contact.id.in_(contact_ids)))
+    return {contact.id: contact for contact in result.scalars().all()}
+
+
+async def delete_checkpoint(db: AsyncSession, name: str) -> None:
+    await db.execute(delete(ScanCheckpoint).where(ScanCheckpoint.name == name))
+
+
+async def get_contact_ids_after(db: AsyncSession, after_id: int, limit: int) -> list[int]:
+    """Contact ids greater than ``after_id`` in ascending order, for keyset-paginated walks."""
+    result = await db.execute(select(Contact.id).where(Contact.id > after_id).order_by(Contact.id).limit(limit))
+    return list(result.scalars().all())
+
+
+async def remove_from_dedupe_index(db: AsyncSession, contact_id: int) -> None:
+    """Drop a contact's blocking keys and any merge candidates that involve it."""
+    await db.execute(delete(DedupeBlock).where(DedupeBlock.contact_id == contact_id))
+    await db.execute(
+        delete(MergeCandidate).where(
+            or_(MergeCandidate.contact_a == contact_id, MergeCandidate.contact_b == contact_id)
+        )
+    )
+
+
+async def replace_dedupe_blocks(db: AsyncSession, contact_id: int, keys: set[str]) -> None:
+    """Replace a contact's blocking keys and its pending (unreviewed) merge candidates."""
+    await db.execute(delete(DedupeBlock).where(DedupeBlock.contact_id == contact_id))
+    await db.execute(
+        delete(MergeCandidate).where(
+            MergeCandidate.status == "pending",
+            or_(MergeCandidate.contact_a == contact_id, MergeCandidate.contact_b == contact_id),
+        )
+    )
+    db.add_all(DedupeBlock(block_key=key, contact_id=contact_id) for key in keys)
+    await db.flush()
+
+
+async def find_block_neighbors(
+    db: AsyncSession,
+    contact_id: int,
+    keys: set[str],
+    max_block_size: int,
+) -> set[int]:
+    """Contacts sharing at least one blocking key, ignoring blocks larger than ``max_block_size``."""
+    if not keys:
+        return set()
+    sizes = await db.execute(
+        select(DedupeBlock.block_key)
+        .where(DedupeBlock.block_key.in_(keys))
+        .group_by(DedupeBlock.block_key)
+        .having(func.count() <= max_block_size)
+    )
+    usable = list(sizes.scalars().all())
+    if not usable:
+        return set()
+    result = await db.execute(
+        select(DedupeBlock.contact_id).where(
+            DedupeBlock.block_key.in_(usable),
+            DedupeBlock.contact_id != contact_id,
+        )
+    )
+    return set(result.scalars().all())
+
+
+async def upsert_merge_candidates(db: AsyncSession, candidates: list[dict[str, Any]]) -> None:
+    """Insert candidate pairs; existing pairs keep their review status but get the new score."""
+    if not candidates:
+        return
+    stmt = sqlite_insert(MergeCandidate).values(candidates)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MergeCandidate.contact_a, MergeCandidate.contact_b],
+        set_={"score": stmt.excluded.score, "reasons": stmt.excluded.reasons},
+    )
+    await db.execute(stmt)
+
+
+async def list_merge_candidates(
+    db: AsyncSession,
+    status: str = "pending",
+    limit: int = 50,
+    offset: int = 0,
+) -> tuple[list[dict[str, Any]], int]:
+    """Merge candidates with both contacts, highest score first.
+
+    Pairs with a contact deleted since the last scan are excluded from both the page and the total.
+    """
+    live_ids = select(Contact.id)
+    conditions = (
+        MergeCandidate.status == status,
+        MergeCandidate.contact_a.in_(live_ids),
+        MergeCandidate.contact_b.in_(live_ids),
+    )
+    stmt = (
+        select(MergeCandidate)
+        .where(*conditions)
+        .order_by(MergeCandidate.score.desc(), MergeCandidate.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    result = await db.execute(stmt)
+    candidates = list(result.scalars().all())
+    contacts = await get_contacts_by_ids(
+        db, {c.contact_a for c in candidates} | {c.contact_b for c in candidates}
+    )
+    total = await db.execute(select(func.count(MergeCandidate.id)).where(*conditions))
+
+    items = [
+        {
+            "id": candidate.id,
+            "score": candidate.score,
+            "reasons": candidate.reasons or [],
+            "status": candidate.status,
+            "contacts": [contacts[candidate.contact_a].to_dict(), contacts[candidate.contact_b].to_dict()],
+        }
+        for candidate in candidates
+    ]
+    return items, total.scalar() or 0
+
+
+async def set_merge_candidate_status(db: AsyncSession, candidate_id: int, status: str) -> bool:
+    result = await db.execute(
+        update(MergeCandidate).where(MergeCandidate.id == candidate_id).values(status=status)
+    )
+    await db.commit()
+    return result.rowcount > 0
@@ -1,21 +1,109 @@
+import asyncio
+import logging
+import time
+import uuid
+
+_IMPORT_STARTED = time.perf_counter()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from backend.core.config import get_settings
+from backend.core.llm import warmup_llm
+from backend.core.ocr import warmup_ocr
+from backend.core.profiling import ProfilingMiddleware
+from backend.core.shared_store import get_shared_store
 from backend.routes.extract import router as extract_router
 from backend.routes.improve import router as improve_router
 from backend.routes.dedupe import router as dedupe_router
 from backend.routes.contacts import router as contacts_router
-from backend.database.connection import init_db
+from backend.routes.admin import router as admin_router
+from backend.database.connection import async_session_maker, configure_db, init_db, warmup_db
+from backend.database.operations import backfill_facets, backfill_name_keys
+from backend.services.duplicate_scanner import duplicate_scan_loop
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> None:
+    """Emit ``backend.*`` logs; uvicorn only configures its own loggers."""
+    backend_logger = logging.getLogger("backend")
+    if backend_logger.handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s:     %(name)s - %(message)s"))
+    backend_logger.addHandler(handler)
+    backend_logger.setLevel(get_settings().log_level.upper())
+
+
+_configure_logging()
+_IMPORT_MS = (time.perf_counter() - _IMPORT_STARTED) * 1000
+
+_WARMUP_STEPS = {
+    "db": warmup_db,
+    "ocr": warmup_ocr,
+    "llm": warmup_llm,
+}
+
+
+async def _run_warmup(steps: list[str]) -> None:
+    """Run warmup steps in the background so /health answers while they complete."""
+    timings: dict[str, str] = {}
+    for step in steps:
+        handler = _WARMUP_STEPS.get(step)
+        if handler is None:
+            logger.warning("Unknown warmup step: %s", step)
+            continue
+        started = time.perf_counter()
+        try:
+            await handler()
+            timings[step] = f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        except Exception as exc:  # warmup is best-effort; the first request retries lazily
+            timings[step] = "failed"
+            logger.warning("Warmup step %s failed: %s", step, exc)
+    logger.info("Warmup finished: %s", timings)
+
+
+async def _prepare_database() -> None:
+    """Create/migrate tables and backfill indexes, one worker process at a time."""
+    store = get_shared_store()
+    holder = uuid.uuid4().hex
+    while not await store.atry_acquire("startup", holder, 1, 120):
+        await asyncio.sleep(0.2)
+    try:
+        await configure_db()
+        await init_db()
+        async with async_session_maker() as db:
+            await backfill_name_keys(db)
+            await backfill_facets(db)
+    finally:
+        await store.arelease("startup", holder)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Initialize database
-    await init_db()
+    # Startup: Initialize database, then warm up providers in the background
+    started = time.perf_counter()
+    await _prepare_database()
+    logger.info(
+        "Startup: imports %.1fms, init_db %.1fms",
+        _IMPORT_MS,
+        (time.perf_counter() - started) * 1000,
+    )
+
+    settings = get_settings()
+    steps = [step.strip() for step in settings.warmup_steps.split(",") if step.strip()]
+    background = []
+    if steps:
+        background.append(asyncio.create_task(_run_warmup(steps)))
+    if settings.dedupe_scan_interval_seconds > 0:
+        background.append(asyncio.create_task(duplicate_scan_loop(settings.dedupe_scan_interval_seconds)))
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: stop warmup and the duplicate scanner
+    for task in background:
+        if not task.done():
+            task.cancel()
 
 
 app = FastAPI(
@@ -27,6 +115,7 @@ app = FastAPI(
 settings = get_settings()
 allowed_origins = [origin.strip() for origin in settings.allow_origin.split(",") if origin.strip()]
 
+app.add_middleware(ProfilingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins or ["*"],
@@ -39,6 +128,7 @@ app.include_router(extract_router, prefix="/extract", tags=["extract"])
 app.include_router(improve_router, prefix="/improve", tags=["improve"])
 app.include_router(dedupe_router, prefix="/dedupe", tags=["dedupe"])
 app.include_router(contacts_router, prefix="/contacts", tags=["contacts"])
+app.include_router(admin_router, prefix="/admin", tags=["admin"])
 
 
 @app.get("/health", tags=["health"])  # pragma: no cover
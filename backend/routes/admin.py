@@ -0,0 +1,52 @@
+"""
+Admin routes for retrieving captured request profiles and SQL timings.
+"""
+
+import hmac
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import JSONResponse
+
+from backend.core.config import get_settings
+from backend.core.profiling import captured_profiles, sql_statistics
+
+router = APIRouter()
+
+
+def _require_admin(token: str | None) -> None:
+    expected = get_settings().profile_admin_token
+    if not expected:
+        raise HTTPException(status_code=404, detail="Profiling admin is disabled")
+    if token is None or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.get("/profiles")
+async def list_profiles(x_admin_token: str | None = Header(None)) -> JSONResponse:
+    """Summaries of captured (sampled or slow) requests, newest first."""
+    _require_admin(x_admin_token)
+    summaries = [
+        {key: profile[key] for key in ("id", "method", "path", "status_code", "started_at", "duration_ms", "reason")}
+        for profile in reversed(captured_profiles())
+    ]
+    return JSONResponse(content={"profiles": summaries})
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: int, x_admin_token: str | None = Header(None)) -> JSONResponse:
+    """Full capture: stage timings, SQL statements, await stack, and sampled call stacks."""
+    _require_admin(x_admin_token)
+    for profile in captured_profiles():
+        if profile["id"] == profile_id:
+            return JSONResponse(content={"profile": profile})
+    raise HTTPException(status_code=404, detail="Profile not found")
+
+
+@router.get("/sql-stats")
+async def get_sql_stats(
+    limit: int = Query(50, ge=1, le=500),
+    x_admin_token: str | None = Header(None),
+) -> JSONResponse:
+    """Aggregated statement timings since process start, by total time."""
+    _require_admin(x_admin_token)
+    return JSONResponse(content={"statements": sql_statistics(limit)})
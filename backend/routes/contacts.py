@@ -2,41 +2,68 @@
 Routes for contact database operations.
 """
 
-from typing import Any
+import asyncio
+import hashlib
+import json
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.database.connection import get_db
+from backend.core.config import get_settings
+from backend.core.responses import FastJSONResponse
+from backend.database.connection import async_session_maker, get_db
 from backend.database.operations import (
+    CONTACT_FIELDS,
+    PROJECTABLE_FIELDS,
+    SUMMARY_FIELDS,
     create_contact,
     get_contact_by_id,
-    search_contacts,
-    get_all_contacts,
+    list_contact_rows,
     get_contact_by_name,
+    fuzzy_search_by_name,
     update_contact,
     delete_contact,
     get_contact_count,
+    get_facet_counts,
+    get_changes_since,
+    get_latest_change_seq,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
+
+_STREAM_POLL_SECONDS = 1.0
+_STREAM_HEARTBEAT_POLLS = 15
+
+
+def _list_etag(seq: int, request: Request) -> str:
+    """Weak ETag for a list response: latest change sequence plus the query parameters."""
+    params = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{request.url.path}?{params}".encode("utf-8")).hexdigest()[:16]
+    return f'W/"{seq}-{digest}"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    return any(tag.strip() in {etag, "*"} for tag in if_none_match.split(","))
 
 
 @router.post("/")
 async def save_contact(
     contact_data: dict[str, Any],
     db: AsyncSession = Depends(get_db),
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Save a new contact to the database."""
     try:
         contact = await create_contact(db, contact_data)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=201,
             content={"contact": contact.to_dict(), "message": "Contact saved successfully"},
         )
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": f"Failed to save contact: {str(e)}"},
         )
@@ -44,66 +71,197 @@ async def save_contact(
 
 @router.get("/")
 async def list_contacts(
+    request: Request,
     query: str | None = Query(None, description="Search query for name/email/phone/company"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    fields: str | None = Query(None, description="Comma-separated columns to return (id is always included)"),
+    view: Literal["full", "summary"] = Query("full", description="'summary' omits notes and extra"),
+    company: str | None = Query(None, description="Exact company (case-insensitive)"),
+    industry: str | None = Query(None, description="Exact inferred industry (case-insensitive)"),
+    department: str | None = Query(None, description="Exact department (case-insensitive)"),
+    job_title: str | None = Query(None, description="Job title substring (case-insensitive)"),
+    website: str | None = Query(None, description="Exact website (case-insensitive)"),
+    address: str | None = Query(None, description="Address substring (case-insensitive)"),
+    if_none_match: str | None = Header(None),
     db: AsyncSession = Depends(get_db),
-) -> JSONResponse:
-    """List all contacts with optional search."""
+) -> Response:
+    """List all contacts with optional search, filters, and column projection.
+
+    Responses carry an ETag; a matching If-None-Match returns 304 before the list query runs.
+    """
+    if fields:
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in requested if field not in PROJECTABLE_FIELDS]
+        if unknown:
+            return FastJSONResponse(
+                status_code=400,
+                content={"error": f"Unknown fields: {', '.join(unknown)}"},
+            )
+        columns = tuple(field for field in PROJECTABLE_FIELDS if field == "id" or field in requested)
+    else:
+        columns = SUMMARY_FIELDS if view == "summary" else CONTACT_FIELDS
+
+    filters = {
+        "company": company,
+        "industry": industry,
+        "department": department,
+        "job_title": job_title,
+        "website": website,
+        "address": address,
+    }
+
     try:
-        if query:
-            contacts = await search_contacts(db, query, limit, offset)
-            total = await get_contact_count(db, query)
-        else:
-            contacts = await get_all_contacts(db, limit, offset)
-            total = await get_contact_count(db)
+        last_seq = await get_latest_change_seq(db)
+        etag = _list_etag(last_seq, request)
+        if _etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        contacts = await list_contact_rows(db, columns, query, limit, offset, filters)
+        total = await get_contact_count(db, query, filters)
         
-        return JSONResponse(
+        return FastJSONResponse(
             content={
-                "contacts": [c.to_dict() for c in contacts],
+                "contacts": contacts,
                 "total": total,
                 "limit": limit,
                 "offset": offset,
-            }
+                "last_seq": last_seq,
+            },
+            headers={"ETag": etag},
         )
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": f"Failed to list contacts: {str(e)}"},
         )
 
 
+@router.get("/facets")
+async def contact_facets(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100, description="Maximum values per facet"),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Contact counts per company, industry, and department."""
+    try:
+        etag = _list_etag(await get_latest_change_seq(db), request)
+        if _etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers={"ETag": etag})
+        return FastJSONResponse(
+            content={"facets": await get_facet_counts(db, limit)},
+            headers={"ETag": etag},
+        )
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=500,
+            content={"error": f"Failed to load facets: {str(e)}"},
+        )
+
+
+@router.get("/changes")
+async def contact_changes(
+    since: int = Query(0, ge=0, description="Return changes after this sequence number"),
+    limit: int = Query(500, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+) -> FastJSONResponse:
+    """Contact creates/updates/deletes since a sequence number, latest change per contact."""
+    try:
+        changes, last_seq, has_more = await get_changes_since(db, since, limit)
+        return FastJSONResponse(
+            content={"changes": changes, "last_seq": last_seq, "has_more": has_more}
+        )
+    except Exception as e:
+        return FastJSONResponse(
+            status_code=500,
+            content={"error": f"Failed to load changes: {str(e)}"},
+        )
+
+
+@router.get("/changes/stream")
+async def stream_contact_changes(
+    request: Request,
+    since: int | None = Query(None, ge=0, description="Start after this sequence number (default: now)"),
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    """Server-sent events stream of contact changes; resumes from Last-Event-ID when reconnecting."""
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    async def events():
+        cursor = since
+        if cursor is None:
+            async with async_session_maker() as db:
+                cursor = await get_latest_change_seq(db)
+        idle_polls = 0
+        while not await request.is_disconnected():
+            async with async_session_maker() as db:
+                changes, cursor, has_more = await get_changes_since(db, cursor)
+            for change in changes:
+                yield f"id: {change['seq']}\nevent: change\ndata: {json.dumps(change)}\n\n"
+            if changes:
+                idle_polls = 0
+            else:
+                idle_polls += 1
+                if idle_polls >= _STREAM_HEARTBEAT_POLLS:
+                    idle_polls = 0
+                    yield ": keep-alive\n\n"
+            if not has_more:
+                await asyncio.sleep(_STREAM_POLL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.get("/{contact_id}")
 async def get_contact(
     contact_id: int,
     db: AsyncSession = Depends(get_db),
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Get a specific contact by ID."""
     contact = await get_contact_by_id(db, contact_id)
     if not contact:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=404,
             content={"error": "Contact not found"},
         )
-    return JSONResponse(content={"contact": contact.to_dict()})
+    return FastJSONResponse(content={"contact": contact.to_dict()})
 
 
 @router.get("/search/by-name")
 async def search_by_name(
     name: str = Query(..., description="Name to search for"),
+    fuzzy: bool = Query(False, description="Typo-tolerant ranked search"),
+    threshold: float = Query(0.5, ge=0, le=1, description="Minimum similarity for fuzzy matches"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum fuzzy matches to return"),
     db: AsyncSession = Depends(get_db),
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Get all contact details by searching name."""
     try:
+        if fuzzy:
+            matches = await fuzzy_search_by_name(
+                db, name, threshold, limit, get_settings().fuzzy_max_key_frequency
+            )
+            return FastJSONResponse(
+                content={
+                    "contacts": [{**c.to_dict(), "score": score} for c, score in matches],
+                    "count": len(matches),
+                }
+            )
+
         contacts = await get_contact_by_name(db, name)
-        return JSONResponse(
+        return FastJSONResponse(
             content={
                 "contacts": [c.to_dict() for c in contacts],
                 "count": len(contacts),
             }
         )
     except Exception as e:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content={"error": f"Search failed: {str(e)}"},
         )
@@ -114,27 +272,27 @@ async def update_contact_route(
     contact_id: int,
     contact_data: dict[str, Any],
     db: AsyncSession = Depends(get_db),
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Update a contact."""
     contact = await update_contact(db, contact_id, contact_data)
     if not contact:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=404,
             content={"error": "Contact not found"},
         )
-    return JSONResponse(content={"contact": contact.to_dict()})
+    return FastJSONResponse(content={"contact": contact.to_dict()})
 
 
 @router.delete("/{contact_id}")
 async def delete_contact_route(
     contact_id: int,
     db: AsyncSession = Depends(get_db),
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Delete a contact."""
     success = await delete_contact(db, contact_id)
     if not success:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=404,
             content={"error": "Contact not found"},
         )
-    return JSONResponse(content={"message": "Contact deleted successfully"})
+    return FastJSONResponse(content={"message": "Contact deleted successfully"})
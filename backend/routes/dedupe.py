@@ -2,12 +2,16 @@
 Intelligent deduplication route using semantic similarity.
 """
 
-from typing import Any
+from typing import Any, Literal
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Depends, Query
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.llm import deduplicate_contacts
+from backend.database.connection import get_db
+from backend.database.operations import list_merge_candidates, set_merge_candidate_status
+from backend.services.duplicate_scanner import run_duplicate_scan
 
 router = APIRouter()
 
@@ -50,3 +54,40 @@ async def dedupe_contacts(payload: dict = Body(...)) -> JSONResponse:
         return JSONResponse(status_code=400, content={"error": str(ve)})
     except RuntimeError as re:
         return JSONResponse(status_code=500, content={"error": str(re)})
+
+
+@router.get("/candidates")
+async def merge_candidates(
+    status: Literal["pending", "dismissed"] = Query("pending"),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> JSONResponse:
+    """Review duplicate pairs found by the background scan of the stored database."""
+    candidates, total = await list_merge_candidates(db, status, limit, offset)
+    return JSONResponse(
+        content={
+            "candidates": candidates,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
+
+
+@router.post("/candidates/{candidate_id}/dismiss")
+async def dismiss_merge_candidate(
+    candidate_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> JSONResponse:
+    """Mark a pair as not duplicates; later scans keep it dismissed."""
+    if not await set_merge_candidate_status(db, candidate_id, "dismissed"):
+        return JSONResponse(status_code=404, content={"error": "Candidate not found"})
+    return JSONResponse(content={"message": "Candidate dismissed"})
+
+
+@router.post("/scan")
+async def scan_for_duplicates(db: AsyncSession = Depends(get_db)) -> JSONResponse:
+    """Run the incremental duplicate scan now instead of waiting for the background task."""
+    stats = await run_duplicate_scan(db)
+    return JSONResponse(content={"meta": stats})
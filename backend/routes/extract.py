@@ -1,19 +1,37 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, Depends
+import hashlib
+
+from fastapi import APIRouter, File, Header, HTTPException, UploadFile, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.config import get_settings
+from backend.core.profiling import stage
+from backend.core.shared_store import get_shared_store
 from backend.services.contact_processor import process_contact_image
+from backend.services.single_flight import SingleFlight
 from backend.database.connection import get_db
-from backend.database.operations import create_contact
+from backend.database.operations import create_contact, get_contacts_by_ids
 
 router = APIRouter()
 
+# Retries and double submits of the same upload share one OCR/LLM run and one set of saved rows.
+_extractions = SingleFlight(
+    ttl_seconds=get_settings().extract_idempotency_ttl_seconds,
+    store=get_shared_store(),
+    namespace="extract",
+)
+
+
+async def _saved_contacts_exist(db: AsyncSession, saved_ids: list[int]) -> bool:
+    return len(await get_contacts_by_ids(db, set(saved_ids))) == len(set(saved_ids))
+
 
 @router.post("/", summary="Extract contacts from an uploaded image")
 async def extract_contacts(
     file: UploadFile = File(...),
+    idempotency_key: str | None = Header(None),
     db: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     if not file.content_type or not file.content_type.startswith("image/"):
@@ -23,20 +41,43 @@ async def extract_contacts(
     if not payload:
         raise HTTPException(status_code=400, detail="Uploaded file is empty")
 
-    try:
+    async def run_pipeline():
         result = await process_contact_image(payload)
         
         # Auto-save extracted contacts to database
         saved_ids = []
-        for contact in result.get("contacts", []):
-            saved_contact = await create_contact(db, contact)
-            saved_ids.append(saved_contact.id)
+        with stage("save"):
+            for contact in result.get("contacts", []):
+                saved_contact = await create_contact(db, contact)
+                saved_ids.append(saved_contact.id)
         
         result["saved_ids"] = saved_ids
-        
+        return result
+
+    digest = hashlib.sha256(payload).hexdigest()
+    if idempotency_key:
+        # A key stays bound to the upload it was first used with; reusing it for another image is a client error.
+        settings = get_settings()
+        store = get_shared_store()
+        bound = await store.aset_if_absent(
+            "extract_keys", idempotency_key, digest, settings.extract_idempotency_ttl_seconds
+        )
+        if bound != digest:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different upload")
+        key = f"key:{idempotency_key}:{digest}"
+    else:
+        key = f"image:{digest}"
+
+    try:
+        result, status = await _extractions.run(key, run_pipeline)
+        if status == "replayed" and not await _saved_contacts_exist(db, result.get("saved_ids", [])):
+            # The contacts saved by the original run were deleted since; extract and save again.
+            await _extractions.forget(key)
+            result, status = await _extractions.run(key, run_pipeline)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:  # Likely OCR/LLM configuration issues
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    result.setdefault("meta", {})["idempotency"] = status
     return JSONResponse(result)
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.core.llm import ContactResponse, improve_contacts as llm_improve_contacts
+from backend.database.connection import get_db
+from backend.services.contact_improver import improve_contacts_incremental
 
 router = APIRouter()
 
 
 @router.post("/", summary="Improve existing contact data")
-async def improve_contacts(payload: dict = Body(...)) -> JSONResponse:
+async def improve_contacts(
+    payload: dict = Body(...),
+    db: AsyncSession = Depends(get_db),
+) -> JSONResponse:
     raw_contacts = payload.get("contacts")
     if raw_contacts is None or not isinstance(raw_contacts, list):
         raise HTTPException(status_code=400, detail="contacts field is required and must be a list")
@@ -17,5 +22,5 @@ async def improve_contacts(payload: dict = Body(...)) -> JSONResponse:
         raise HTTPException(status_code=400, detail="Each contact entry must be an object")
 
     instructions = payload.get("instructions")
-    structured = await llm_improve_contacts(raw_contacts, instructions=instructions)
-    return JSONResponse(ContactResponse(contacts=structured.contacts).model_dump())
+    result = await improve_contacts_incremental(db, raw_contacts, instructions=instructions)
+    return JSONResponse(result)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import get_settings
+from backend.core.llm import contact_content_hash, improve_contacts
+from backend.database.operations import get_improved_contacts, prune_improved_contacts, save_improved_contacts
+
+
+async def improve_contacts_incremental(
+    db: AsyncSession,
+    contacts: list[dict[str, Any]],
+    instructions: str | None = None,
+) -> dict[str, Any]:
+    """Improve contacts, serving unchanged ones from the store and sending only the rest to the LLM.
+
+    Each result is stored under the hash of its input and of its own content, so re-running
+    improve on an already improved list is served entirely from the store. Entries expire after
+    ``improve_store_ttl_seconds`` and are pruned whenever new results are saved.
+    """
+    ttl = get_settings().improve_store_ttl_seconds
+    keys = [contact_content_hash(contact, instructions) for contact in contacts]
+    stored = await get_improved_contacts(db, set(keys), ttl)
+    from_store = [key in stored for key in keys]
+    results: list[dict[str, Any] | None] = [stored.get(key) for key in keys]
+
+    pending = [index for index, hit in enumerate(from_store) if not hit]
+    meta: dict[str, Any] = {}
+    if pending:
+        improved = await improve_contacts([contacts[index] for index in pending], instructions)
+        meta.update(improved.meta)
+        entries: dict[str, dict[str, Any]] = {}
+        for index, contact in zip(pending, improved.contacts):
+            payload = contact.model_dump()
+            results[index] = payload
+            entries[keys[index]] = payload
+            entries[contact_content_hash(payload, instructions)] = payload
+        await prune_improved_contacts(db, ttl)
+        await save_improved_contacts(db, entries)
+
+    meta["from_store"] = from_store
+    meta["store_hits"] = sum(from_store)
+    return {"contacts": results, "meta": meta}
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import time
+
 from backend.core.llm import structure_contacts
 from backend.core.normalize import normalize_email, normalize_phone
 from backend.core.ocr import run_ocr
+from backend.core.profiling import stage
 
 
 async def process_contact_image(image_bytes: bytes):
     """Run OCR + LLM structuring pipeline."""
-    ocr_result = await run_ocr(image_bytes)
-    structured = await structure_contacts(ocr_result["text"])
+    started = time.perf_counter()
+    with stage("ocr"):
+        ocr_result = await run_ocr(image_bytes)
+    ocr_ms = round((time.perf_counter() - started) * 1000, 2)
+    with stage("llm_structure"):
+        structured = await structure_contacts(ocr_result["text"])
     contacts: list[dict] = []
     for contact in structured.contacts:
         payload = contact.model_dump()
@@ -21,5 +28,8 @@ async def process_contact_image(image_bytes: bytes):
         "meta": {
             "ocr_confidence": ocr_result.get("confidence"),
             "ocr_text": ocr_result.get("text"),
+            "ocr_pass": ocr_result.get("ocr_pass"),
+            "ocr_variant": ocr_result.get("variant"),
+            "ocr_ms": ocr_ms,
         },
     }
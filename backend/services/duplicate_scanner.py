@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import get_settings
+from backend.core.fuzzy import name_similarity, normalize_name, soundex
+from backend.core.normalize import normalize_email
+from backend.core.shared_store import get_shared_store
+from backend.database.connection import async_session_maker
+from backend.database.models import Contact
+from backend.database.operations import (
+    delete_checkpoint,
+    find_block_neighbors,
+    get_changes_since,
+    get_checkpoint,
+    get_contact_ids_after,
+    get_contacts_by_ids,
+    get_latest_change_seq,
+    remove_from_dedupe_index,
+    replace_dedupe_blocks,
+    set_checkpoint,
+    upsert_merge_candidates,
+)
+
+logger = logging.getLogger(__name__)
+
+SCANNER_NAME = "duplicates"
+# Last contact id indexed by the first (full) scan; removed once that scan completes.
+BACKFILL_NAME = "duplicates:backfill"
+# Different names are different people even when they share contact details.
+_MIN_NAME_SIMILARITY = 0.6
+# One scan at a time across all worker processes; the lease expires if a worker dies mid-scan.
+_SCAN_LEASE_SECONDS = 600
+
+
+def _phone_digits(raw: str | None) -> str | None:
+    digits = re.sub(r"\D", "", raw or "")
+    return digits[-10:] if len(digits) >= 7 else None
+
+
+def blocking_keys(contact: Contact) -> set[str]:
+    """Keys grouping contacts worth comparing: email, phone digits, and phonetic name tokens."""
+    keys: set[str] = set()
+    email = normalize_email(contact.email)
+    if email and "@" in email:
+        keys.add(f"e:{email}")
+    phone = _phone_digits(contact.phone)
+    if phone:
+        keys.add(f"p:{phone}")
+    keys.update(f"n:{soundex(token)}" for token in normalize_name(contact.name) if len(token) > 1)
+    return keys
+
+
+def score_pair(a: Contact, b: Contact) -> tuple[float, list[str]] | None:
+    """Score two contacts as the same person: close names plus a shared email or phone."""
+    similarity = name_similarity(a.name, b.name)
+    if similarity < _MIN_NAME_SIMILARITY:
+        return None
+    reasons = ["name"]
+    email_a, email_b = normalize_email(a.email), normalize_email(b.email)
+    if email_a and email_a == email_b:
+        reasons.append("email")
+    phone_a, phone_b = _phone_digits(a.phone), _phone_digits(b.phone)
+    if phone_a and phone_a == phone_b:
+        reasons.append("phone")
+    shared_contact = 1.0 if len(reasons) > 1 else 0.0
+    return round(0.5 * similarity + 0.5 * shared_contact, 4), reasons
+
+
+async def run_duplicate_scan(db: AsyncSession, wait: bool = True) -> dict[str, Any] | None:
+    """Compare contacts changed since the last checkpoint against the blocking index.
+
+    The first run indexes every stored contact; later runs only touch the change feed delta.
+    Returns None without scanning when ``wait`` is false and another scan is running.
+    """
+    store = get_shared_store()
+    holder = uuid.uuid4().hex
+    while not await store.atry_acquire(SCANNER_NAME, holder, 1, _SCAN_LEASE_SECONDS):
+        if not wait:
+            return None
+        await asyncio.sleep(0.2)
+    try:
+        return await _scan(db)
+    finally:
+        await store.arelease(SCANNER_NAME, holder)
+
+
+async def _scan(db: AsyncSession) -> dict[str, Any]:
+    """Index and compare contacts in batches, committing each batch with its checkpoint.
+
+    Short transactions keep the SQLite write lock available to request handlers in every worker,
+    and an interrupted scan resumes from the last committed batch.
+    """
+    batch_size = get_settings().dedupe_scan_batch_size
+    stats = {"scanned": 0, "deleted": 0, "candidates": 0}
+
+    cursor = await get_checkpoint(db, SCANNER_NAME)
+    if cursor is None:
+        # First run: index every stored contact, then follow the change feed from this point.
+        cursor = await get_latest_change_seq(db)
+        await set_checkpoint(db, SCANNER_NAME, cursor)
+        await set_checkpoint(db, BACKFILL_NAME, 0)
+        await db.commit()
+
+    last_id = await get_checkpoint(db, BACKFILL_NAME)
+    while last_id is not None:
+        contact_ids = await get_contact_ids_after(db, last_id, batch_size)
+        await _scan_batch(db, set(contact_ids), set(), stats)
+        if len(contact_ids) < batch_size:
+            await delete_checkpoint(db, BACKFILL_NAME)
+            last_id = None
+        else:
+            last_id = contact_ids[-1]
+            await set_checkpoint(db, BACKFILL_NAME, last_id)
+        await db.commit()
+
+    has_more = True
+    while has_more:
+        changes, next_cursor, has_more = await get_changes_since(db, cursor, batch_size)
+        if not changes:
+            break
+        changed: set[int] = set()
+        deleted: set[int] = set()
+        for change in changes:
+            if change["op"] == "delete":
+                changed.discard(change["id"])
+                deleted.add(change["id"])
+            else:
+                deleted.discard(change["id"])
+                changed.add(change["id"])
+        await _scan_batch(db, changed, deleted, stats)
+        cursor = next_cursor
+        await set_checkpoint(db, SCANNER_NAME, cursor)
+        await db.commit()
+
+    return {**stats, "checkpoint": cursor}
+
+
+async def _scan_batch(db: AsyncSession, changed: set[int], deleted: set[int], stats: dict[str, int]) -> None:
+    settings = get_settings()
+    for contact_id in deleted:
+        await remove_from_dedupe_index(db, contact_id)
+    stats["deleted"] += len(deleted)
+
+    contacts = await get_contacts_by_ids(db, changed)
+    for contact_id in sorted(changed):
+        contact = contacts.get(contact_id)
+        if contact is None:
+            await remove_from_dedupe_index(db, contact_id)
+            continue
+        keys = blocking_keys(contact)
+        await replace_dedupe_blocks(db, contact_id, keys)
+        neighbor_ids = await find_block_neighbors(db, contact_id, keys, settings.dedupe_max_block_size)
+        neighbors = await get_contacts_by_ids(db, neighbor_ids)
+
+        candidates = []
+        for other in neighbors.values():
+            scored = score_pair(contact, other)
+            if scored is None or scored[0] < settings.dedupe_min_score:
+                continue
+            candidates.append(
+                {
+                    "contact_a": min(contact_id, other.id),
+                    "contact_b": max(contact_id, other.id),
+                    "score": scored[0],
+                    "reasons": scored[1],
+                }
+            )
+        await upsert_merge_candidates(db, candidates)
+        stats["candidates"] += len(candidates)
+    stats["scanned"] += len(changed)
+
+
+async def duplicate_scan_loop(interval_seconds: float) -> None:
+    """Run the incremental duplicate scan periodically until cancelled."""
+    while True:
+        try:
+            async with async_session_maker() as db:
+                stats = await run_duplicate_scan(db, wait=False)
+            if stats and (stats["scanned"] or stats["deleted"]):
+                logger.info("Duplicate scan: %s", stats)
+        except Exception:  # keep the loop alive; the next run resumes from the checkpoint
+            logger.exception("Duplicate scan failed")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from backend.core.shared_store import SharedStore
+
+
+class SingleFlight:
+    """Coalesce concurrent calls sharing a key and replay completed results for a time window.
+
+    With a shared ``store``, coalescing and replay also span worker processes: one process holds
+    a lease for the key while the others wait for its stored result. Failed executions are not
+    remembered, so a retry after an error runs again.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 600,
+        max_entries: int = 1024,
+        store: SharedStore | None = None,
+        namespace: str = "single_flight",
+        lease_seconds: float = 300,
+        poll_seconds: float = 0.1,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.store = store
+        self.namespace = namespace
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._completed: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> tuple[Any, str]:
+        """Return ``(result, status)`` where status is ``executed``, ``coalesced`` or ``replayed``."""
+        self._evict(time.monotonic())
+        if key in self._completed:
+            return copy.deepcopy(self._completed[key][1]), "replayed"
+        if self.store is not None:
+            stored = await self.store.aget(self.namespace, key)
+            if stored is not None:
+                return stored, "replayed"
+
+        future = self._inflight.get(key)
+        owner = future is None
+        if future is None:
+            future = asyncio.ensure_future(self._execute(key, factory))
+            future.add_done_callback(lambda done: self._finish(key, done))
+            self._inflight[key] = future
+
+        # Shield so a disconnecting caller does not cancel the execution others are waiting on.
+        result, status = await asyncio.shield(future)
+        return copy.deepcopy(result), status if owner else "coalesced"
+
+    async def forget(self, key: str) -> None:
+        """Drop a completed result so the next call for ``key`` executes again."""
+        self._completed.pop(key, None)
+        if self.store is not None:
+            await self.store.adelete(self.namespace, key)
+
+    async def _execute(self, key: str, factory: Callable[[], Awaitable[Any]]) -> tuple[Any, str]:
+        if self.store is None:
+            return await factory(), "executed"
+
+        lease = f"{self.namespace}:{key}"
+        holder = uuid.uuid4().hex
+        while not await self.store.atry_acquire(lease, holder, 1, self.lease_seconds):
+            await asyncio.sleep(self.poll_seconds)
+            stored = await self.store.aget(self.namespace, key)
+            if stored is not None:
+                return stored, "coalesced"
+        try:
+            # Another process may have finished between our cache check and taking the lease.
+            stored = await self.store.aget(self.namespace, key)
+            if stored is not None:
+                return stored, "coalesced"
+            result = await factory()
+            await self.store.aset(self.namespace, key, result, self.ttl_seconds)
+            return result, "executed"
+        finally:
+            await self.store.arelease(lease, holder)
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._completed[key] = (time.monotonic(), future.result()[0])
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        while self._completed:
+            key, (finished_at, _) = next(iter(self._completed.items()))
+            if now - finished_at < self.ttl_seconds:
+                break
+            self._completed.popitem(last=False)
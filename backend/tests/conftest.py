@@ -0,0 +1,40 @@
+import asyncio
+import os
+import tempfile
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+# Keep the cross-process cache out of the working tree; must be set before settings load.
+os.environ.setdefault("SHARED_STORE_PATH", os.path.join(tempfile.mkdtemp(), "shared_cache.db"))
+
+from backend.database.connection import get_db  # noqa: E402
+from backend.database.models import Base  # noqa: E402
+from backend.main import app  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_db():
+    """Route the get_db dependency to a fresh in-memory database for each test."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield session_maker
+    app.dependency_overrides.pop(get_db, None)
+    asyncio.run(engine.dispose())
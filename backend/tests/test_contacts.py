@@ -0,0 +1,192 @@
+from fastapi.testclient import TestClient
+
+from backend.core.config import get_settings
+from backend.main import app
+
+client = TestClient(app)
+
+
+def _seed(client, *contacts):
+    return [client.post("/contacts/", json=contact).json()["contact"]["id"] for contact in contacts]
+
+
+def test_list_contacts_full_shape():
+    _seed(client, {"name": "Ada Lovelace", "notes": "met at expo", "extra": {"job_title": "CTO"}})
+
+    body = client.get("/contacts/").json()
+    assert body["total"] == 1
+    contact = body["contacts"][0]
+    assert contact["extra"] == {"job_title": "CTO"}
+    assert contact["notes"] == "met at expo"
+    assert "created_at" in contact
+
+
+def test_list_contacts_summary_omits_heavy_fields():
+    _seed(client, {"name": "Ada Lovelace", "notes": "n", "extra": {"a": 1}})
+
+    contact = client.get("/contacts/", params={"view": "summary"}).json()["contacts"][0]
+    assert "extra" not in contact
+    assert "notes" not in contact
+    assert contact["name"] == "Ada Lovelace"
+
+
+def test_list_contacts_field_projection():
+    _seed(client, {"name": "Ada Lovelace", "email": "ada@example.com", "phone": "+1555"})
+
+    contact = client.get("/contacts/", params={"fields": "name,email"}).json()["contacts"][0]
+    assert set(contact) == {"id", "name", "email"}
+
+
+def test_list_contacts_rejects_unknown_fields():
+    response = client.get("/contacts/", params={"fields": "name,password"})
+    assert response.status_code == 400
+    assert "password" in response.json()["error"]
+
+
+def test_fuzzy_name_search_tolerates_typos():
+    _seed(
+        client,
+        {"name": "John Smith"},
+        {"name": "Olivia Wilson"},
+        {"name": "Mariana Anderson"},
+    )
+
+    body = client.get("/contacts/search/by-name", params={"name": "Jonh Smtih", "fuzzy": True}).json()
+    assert [c["name"] for c in body["contacts"]] == ["John Smith"]
+    assert 0 < body["contacts"][0]["score"] <= 1
+
+    body = client.get("/contacts/search/by-name", params={"name": "0livia", "fuzzy": True}).json()
+    assert body["contacts"][0]["name"] == "Olivia Wilson"
+
+
+def test_fuzzy_name_search_skips_frequent_keys(monkeypatch):
+    monkeypatch.setattr(get_settings(), "fuzzy_max_key_frequency", 2)
+    _seed(client, {"name": "John Adams"}, {"name": "John Brown"}, {"name": "John Clark"}, {"name": "John Smith"})
+
+    body = client.get("/contacts/search/by-name", params={"name": "Jonh Smtih", "fuzzy": True}).json()
+    assert [c["name"] for c in body["contacts"]] == ["John Smith"]
+
+
+def test_fuzzy_name_index_follows_updates_and_deletes():
+    (contact_id,) = _seed(client, {"name": "John Smith"})
+    client.put(f"/contacts/{contact_id}", json={"name": "Priya Natarajan"})
+
+    params = {"fuzzy": True}
+    assert client.get("/contacts/search/by-name", params={**params, "name": "John Smith"}).json()["count"] == 0
+    assert client.get("/contacts/search/by-name", params={**params, "name": "Priya Natarjan"}).json()["count"] == 1
+
+    client.delete(f"/contacts/{contact_id}")
+    assert client.get("/contacts/search/by-name", params={**params, "name": "Priya Natarajan"}).json()["count"] == 0
+
+
+def test_list_contacts_filters_on_extra_fields():
+    _seed(
+        client,
+        {"name": "Ada", "company": "Acme", "extra": {"job_title": "VP Engineering", "inferred_industry": "Tech"}},
+        {"name": "Bob", "company": "Acme", "extra": {"job_title": "Engineer", "inferred_industry": "Tech"}},
+        {"name": "Cy", "company": "Farmco", "extra": {"job_title": "VP Sales", "inferred_industry": "Agriculture"}},
+    )
+
+    body = client.get("/contacts/", params={"job_title": "vp", "industry": "tech"}).json()
+    assert body["total"] == 1
+    assert body["contacts"][0]["name"] == "Ada"
+
+    contact = client.get("/contacts/", params={"company": "ACME", "fields": "name,job_title"}).json()["contacts"][0]
+    assert set(contact) == {"id", "name", "job_title"}
+    assert contact["job_title"] in {"VP Engineering", "Engineer"}
+
+
+def test_facet_values_work_as_filters():
+    _seed(
+        client,
+        {"name": "Ada", "company": "École Polytechnique", "extra": {"department": "Sales\t"}},
+        {"name": "Bob", "company": " Acme ", "extra": {"department": " Sales "}},
+    )
+
+    facets = client.get("/contacts/facets").json()["facets"]
+    for facet, param in (("company", "company"), ("department", "department")):
+        for entry in facets[facet]:
+            body = client.get("/contacts/", params={param: entry["value"]}).json()
+            assert body["total"] == entry["count"], (facet, entry)
+
+
+def test_non_string_extra_values_match_generated_columns():
+    _seed(
+        client,
+        {"name": "Ada", "extra": {"department": 5, "inferred_industry": 2.0}},
+        {"name": "Bob", "extra": {"department": True, "inferred_industry": ["Tech", "AI"]}},
+    )
+
+    facets = client.get("/contacts/facets").json()["facets"]
+    assert {entry["value"] for entry in facets["department"]} == {"5", "1"}
+    assert {entry["value"] for entry in facets["industry"]} == {"2.0", '["tech","ai"]'}
+    for facet in ("department", "industry"):
+        for entry in facets[facet]:
+            assert client.get("/contacts/", params={facet: entry["value"]}).json()["total"] == entry["count"]
+
+
+def test_create_ignores_generated_columns():
+    response = client.post("/contacts/", json={"name": "B", "website": "x.com", "extra": {"website": "Y.com"}})
+    assert response.status_code == 201
+    contact = client.get("/contacts/", params={"fields": "website"}).json()["contacts"][0]
+    assert contact["website"] == "Y.com"
+
+
+def test_facet_counts_track_writes():
+    ada, bob = _seed(
+        client,
+        {"name": "Ada", "company": "Acme", "extra": {"department": "Sales"}},
+        {"name": "Bob", "company": "acme ", "extra": {"department": "Sales", "inferred_industry": "Tech"}},
+    )
+
+    facets = client.get("/contacts/facets").json()["facets"]
+    assert facets["company"] == [{"value": "acme", "count": 2}]
+    assert facets["department"] == [{"value": "sales", "count": 2}]
+    assert facets["industry"] == [{"value": "tech", "count": 1}]
+
+    client.put(f"/contacts/{ada}", json={"company": "Globex", "extra": {"department": "HR"}})
+    client.delete(f"/contacts/{bob}")
+
+    facets = client.get("/contacts/facets").json()["facets"]
+    assert facets["company"] == [{"value": "globex", "count": 1}]
+    assert facets["department"] == [{"value": "hr", "count": 1}]
+    assert facets["industry"] == []
+
+
+def test_change_feed_returns_deltas_and_tombstones():
+    ada, bob, _ = _seed(client, {"name": "Ada"}, {"name": "Bob"}, {"name": "Dee"})
+    since = client.get("/contacts/changes").json()["last_seq"]
+
+    client.put(f"/contacts/{ada}", json={"company": "Acme"})
+    client.delete(f"/contacts/{bob}")
+    (cy,) = _seed(client, {"name": "Cy"})
+
+    body = client.get("/contacts/changes", params={"since": since}).json()
+    assert [(c["op"], c["id"]) for c in body["changes"]] == [("update", ada), ("delete", bob), ("create", cy)]
+    assert body["changes"][0]["contact"]["company"] == "Acme"
+    assert body["changes"][1]["contact"] is None
+    assert body["has_more"] is False
+
+    assert client.get("/contacts/changes", params={"since": body["last_seq"]}).json()["changes"] == []
+
+    (dee,) = _seed(client, {"name": "Dee"})
+    client.put(f"/contacts/{dee}", json={"notes": "edited"})
+    changes = client.get("/contacts/changes", params={"since": body["last_seq"]}).json()["changes"]
+    assert [(c["op"], c["id"]) for c in changes] == [("create", dee)]
+
+
+def test_list_contacts_etag_returns_304_until_data_changes():
+    _seed(client, {"name": "Ada"})
+
+    first = client.get("/contacts/", params={"limit": 10})
+    etag = first.headers["etag"]
+    cached = client.get("/contacts/", params={"limit": 10}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    other_page = client.get("/contacts/", params={"limit": 20}, headers={"If-None-Match": etag})
+    assert other_page.status_code == 200
+
+    _seed(client, {"name": "Bob"})
+    changed = client.get("/contacts/", params={"limit": 10}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["total"] == 2
@@ -0,0 +1,68 @@
+from fastapi.testclient import TestClient
+
+from backend.core.config import get_settings
+from backend.main import app
+
+client = TestClient(app)
+
+
+def _seed(*contacts):
+    return [client.post("/contacts/", json=contact).json()["contact"]["id"] for contact in contacts]
+
+
+def test_scan_finds_duplicates_and_skips_different_people():
+    john, j_smith, _ = _seed(
+        {"name": "John Smith", "email": "john@acme.com"},
+        {"name": "J. Smith", "email": "JOHN@acme.com"},
+        {"name": "Jane Doe", "email": "john@acme.com"},
+    )
+
+    assert client.post("/dedupe/scan").json()["meta"]["scanned"] == 3
+
+    body = client.get("/dedupe/candidates").json()
+    assert body["total"] == 1
+    candidate = body["candidates"][0]
+    assert [c["id"] for c in candidate["contacts"]] == [john, j_smith]
+    assert candidate["reasons"] == ["name", "email"]
+
+
+def test_scan_is_incremental_and_respects_dismissals():
+    (ada,) = _seed({"name": "Ada Lovelace", "phone": "+1 555 010 0001"})
+    client.post("/dedupe/scan")
+
+    (ada2,) = _seed({"name": "Ada Lovelace", "phone": "5550100001"})
+    stats = client.post("/dedupe/scan").json()["meta"]
+    assert stats["scanned"] == 1
+    assert stats["candidates"] == 1
+
+    candidate_id = client.get("/dedupe/candidates").json()["candidates"][0]["id"]
+    client.post(f"/dedupe/candidates/{candidate_id}/dismiss")
+    client.put(f"/contacts/{ada2}", json={"notes": "edited"})
+    client.post("/dedupe/scan")
+    assert client.get("/dedupe/candidates").json()["total"] == 0
+    assert client.get("/dedupe/candidates", params={"status": "dismissed"}).json()["total"] == 1
+
+    client.delete(f"/contacts/{ada}")
+    assert client.post("/dedupe/scan").json()["meta"]["deleted"] == 1
+    assert client.get("/dedupe/candidates", params={"status": "dismissed"}).json()["total"] == 0
+
+
+def test_scan_commits_in_batches_and_hides_deleted_pairs(monkeypatch):
+    monkeypatch.setattr(get_settings(), "dedupe_scan_batch_size", 2)
+    ids = _seed(
+        {"name": "John Smith", "email": "john@acme.com"},
+        {"name": "Jon Smith", "email": "john@acme.com"},
+        {"name": "Mary Major", "phone": "555 010 0002"},
+        {"name": "Mary Majors", "phone": "+1 555 010 0002"},
+        {"name": "Solo Person"},
+    )
+
+    stats = client.post("/dedupe/scan").json()["meta"]
+    assert stats["scanned"] == 5
+    assert client.get("/dedupe/candidates").json()["total"] == 2
+
+    # Deleted before the next scan: the stale pair is neither listed nor counted.
+    client.delete(f"/contacts/{ids[0]}")
+    body = client.get("/dedupe/candidates").json()
+    assert body["total"] == 1
+    assert len(body["candidates"]) == 1
@@ -29,3 +29,61 @@ def test_extract_success(monkeypatch):
     body = response.json()
     assert body["contacts"][0]["name"] == "Test User"
     assert body["meta"]["ocr_confidence"] == 0.9
+
+
+def test_extract_retry_replays_saved_ids(monkeypatch):
+    calls = []
+
+    async def fake_process(_: bytes):
+        calls.append(1)
+        return {"contacts": [{"name": "Retry User"}], "meta": {}}
+
+    monkeypatch.setattr("backend.routes.extract.process_contact_image", fake_process)
+
+    upload = {"file": ("card.png", b"retry-card-bytes", "image/png")}
+    first = client.post("/extract/", files=upload).json()
+    retry = client.post("/extract/", files=upload).json()
+
+    assert len(calls) == 1
+    assert retry["saved_ids"] == first["saved_ids"]
+    assert first["meta"]["idempotency"] == "executed"
+    assert retry["meta"]["idempotency"] == "replayed"
+
+
+def test_extract_idempotency_key_header(monkeypatch):
+    calls = []
+
+    async def fake_process(_: bytes):
+        calls.append(1)
+        return {"contacts": [{"name": "Keyed User"}], "meta": {}}
+
+    monkeypatch.setattr("backend.routes.extract.process_contact_image", fake_process)
+
+    headers = {"Idempotency-Key": "upload-123"}
+    first = client.post("/extract/", files={"file": ("a.png", b"keyed-a", "image/png")}, headers=headers)
+    retry = client.post("/extract/", files={"file": ("a.png", b"keyed-a", "image/png")}, headers=headers)
+    reused = client.post("/extract/", files={"file": ("b.png", b"keyed-b", "image/png")}, headers=headers)
+
+    assert len(calls) == 1
+    assert retry.json()["saved_ids"] == first.json()["saved_ids"]
+    assert retry.json()["meta"]["idempotency"] == "replayed"
+    assert reused.status_code == 422
+
+
+def test_extract_reruns_when_replayed_contacts_were_deleted(monkeypatch):
+    calls = []
+
+    async def fake_process(_: bytes):
+        calls.append(1)
+        return {"contacts": [{"name": "Deleted User"}], "meta": {}}
+
+    monkeypatch.setattr("backend.routes.extract.process_contact_image", fake_process)
+
+    upload = {"file": ("card.png", b"deleted-card-bytes", "image/png")}
+    first = client.post("/extract/", files=upload).json()
+    client.delete(f"/contacts/{first['saved_ids'][0]}")
+    again = client.post("/extract/", files=upload).json()
+
+    assert len(calls) == 2
+    assert again["meta"]["idempotency"] == "executed"
+    assert client.get(f"/contacts/{again['saved_ids'][0]}").status_code == 200
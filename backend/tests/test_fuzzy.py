@@ -0,0 +1,23 @@
+from backend.core.fuzzy import name_keys, name_similarity, normalize_name, soundex
+
+
+def test_soundex_reference_codes():
+    assert soundex("robert") == "R163"
+    assert soundex("rupert") == "R163"
+    assert soundex("ashcraft") == "A261"
+    assert soundex("tymczak") == "T522"
+
+
+def test_normalize_name_undoes_ocr_digits():
+    assert normalize_name("0livia Wi1son") == ["olivia", "wilson"]
+
+
+def test_name_keys_include_trigrams_and_phonetic_codes():
+    keys = name_keys("Ada")
+    assert "t:ada" in keys
+    assert "p:A300" in keys
+
+
+def test_name_similarity_ranks_typos_above_unrelated_names():
+    assert name_similarity("Jonh Smtih", "John Smith") > 0.5
+    assert name_similarity("Jonh Smtih", "Olivia Wilson") < 0.2
@@ -0,0 +1,163 @@
+import asyncio
+import json
+
+from backend.core import llm
+from backend.core.config import get_settings
+from backend.services import contact_improver
+
+
+def _echo_model(calls):
+    async def fake_invoke(prompt: str) -> llm.ContactResponse:
+        calls.append(prompt)
+        payload = prompt.split("null):\n", 1)[1].split("\n\nAdditional guidance", 1)[0]
+        items = json.loads(payload)
+        return llm.ContactResponse(contacts=[llm.Contact(name=item.get("n")) for item in items])
+
+    return fake_invoke
+
+
+def test_compact_contact_drops_nulls_and_shortens_keys():
+    compact = llm._compact_contact(
+        {"name": "Ada", "phone": None, "email": "", "extra": {"job_title": "CTO", "website": None}}
+    )
+    assert compact == {"n": "Ada", "x": {"job_title": "CTO"}}
+
+
+def test_improve_chunks_preserve_order(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(llm, "_invoke_model", _echo_model(calls))
+    monkeypatch.setattr(get_settings(), "improve_chunk_size", 3)
+
+    contacts = [{"name": f"Person {i}", "phone": None} for i in range(10)]
+    result = asyncio.run(llm.improve_contacts(contacts))
+
+    assert [c.name for c in result.contacts] == [f"Person {i}" for i in range(10)]
+    assert len(calls) == 4
+    assert result.meta["chunks"] == 4
+    assert result.meta["prompt_tokens_after"] > 0
+
+
+def test_improve_retries_failed_chunk_only(monkeypatch):
+    calls: list[str] = []
+    echo = _echo_model(calls)
+    failures = {"count": 0}
+
+    async def flaky_invoke(prompt: str) -> llm.ContactResponse:
+        if "Person 3" in prompt and failures["count"] == 0:
+            failures["count"] += 1
+            raise ValueError("malformed JSON")
+        return await echo(prompt)
+
+    monkeypatch.setattr(llm, "_invoke_model", flaky_invoke)
+    monkeypatch.setattr(get_settings(), "improve_chunk_size", 3)
+
+    contacts = [{"name": f"Person {i}"} for i in range(6)]
+    result = asyncio.run(llm.improve_contacts(contacts))
+
+    assert [c.name for c in result.contacts] == [f"Person {i}" for i in range(6)]
+    assert failures["count"] == 1
+    assert len(calls) == 2
+
+
+def test_improve_cancels_remaining_chunks_after_a_failure(monkeypatch):
+    calls: list[str] = []
+    echo = _echo_model(calls)
+
+    async def failing_invoke(prompt: str) -> llm.ContactResponse:
+        if "Person 0" in prompt:
+            raise ValueError("malformed JSON")
+        await asyncio.sleep(0.05)
+        return await echo(prompt)
+
+    monkeypatch.setattr(llm, "_invoke_model", failing_invoke)
+    monkeypatch.setattr(get_settings(), "improve_chunk_size", 1)
+    monkeypatch.setattr(get_settings(), "improve_concurrency", 2)
+    monkeypatch.setattr(get_settings(), "improve_max_retries", 0)
+
+    contacts = [{"name": f"Person {i}"} for i in range(6)]
+
+    async def scenario():
+        try:
+            await llm.improve_contacts(contacts)
+        except ValueError:
+            await asyncio.sleep(0.1)
+            return True
+        return False
+
+    assert asyncio.run(scenario())
+    assert calls == []
+
+
+def test_incremental_improve_serves_unchanged_contacts_from_store(monkeypatch, isolated_db):
+    calls: list[str] = []
+    echo = _echo_model(calls)
+
+    async def upper_invoke(prompt: str) -> llm.ContactResponse:
+        result = await echo(prompt)
+        return llm.ContactResponse(contacts=[llm.Contact(name=c.name.upper()) for c in result.contacts])
+
+    monkeypatch.setattr(llm, "_invoke_model", upper_invoke)
+
+    async def scenario():
+        async with isolated_db() as db:
+            first = await contact_improver.improve_contacts_incremental(
+                db, [{"name": "ada"}, {"name": "bob"}]
+            )
+            rerun = await contact_improver.improve_contacts_incremental(db, first["contacts"])
+            edited = await contact_improver.improve_contacts_incremental(
+                db, [{"name": "ada"}, {"name": "carol"}]
+            )
+        return first, rerun, edited
+
+    first, rerun, edited = asyncio.run(scenario())
+
+    assert [c["name"] for c in first["contacts"]] == ["ADA", "BOB"]
+    assert first["meta"]["from_store"] == [False, False]
+    assert [c["name"] for c in rerun["contacts"]] == ["ADA", "BOB"]
+    assert rerun["meta"]["from_store"] == [True, True]
+    assert [c["name"] for c in edited["contacts"]] == ["ADA", "CAROL"]
+    assert edited["meta"]["from_store"] == [True, False]
+    assert len(calls) == 2
+
+
+def test_incremental_improve_expires_and_prunes_stored_results(monkeypatch, isolated_db):
+    from sqlalchemy import func, select
+
+    from backend.database.models import ImprovedContact
+
+    calls: list[str] = []
+    monkeypatch.setattr(llm, "_invoke_model", _echo_model(calls))
+    monkeypatch.setattr(get_settings(), "improve_store_ttl_seconds", 0)
+
+    async def scenario():
+        async with isolated_db() as db:
+            await contact_improver.improve_contacts_incremental(db, [{"name": "ada"}])
+            again = await contact_improver.improve_contacts_incremental(db, [{"name": "bob"}])
+            stored = await db.scalar(select(func.count()).select_from(ImprovedContact))
+        return again, stored
+
+    again, stored = asyncio.run(scenario())
+
+    assert again["meta"]["from_store"] == [False]
+    assert len(calls) == 2
+    # "ada" entries were pruned before "bob" was saved (input and output hash are the same here).
+    assert stored == 1
+
+
+def test_llm_budget_limits_concurrent_calls(monkeypatch):
+    monkeypatch.setattr(get_settings(), "llm_max_concurrency", 2)
+    active = []
+    peak = []
+
+    async def call():
+        async with llm._llm_budget():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.02)
+            active.pop()
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert max(peak) == 2
@@ -1,4 +1,4 @@
-from backend.core.normalize import normalize_email, normalize_phone
+from backend.core.normalize import count_contact_fields, normalize_email, normalize_phone
 
 
 def test_normalize_phone_basic():
@@ -15,3 +15,8 @@ def test_normalize_email_lowercase():
 
 def test_normalize_email_missing_at():
     assert normalize_email("example.com") == "example.com"
+
+
+def test_count_contact_fields():
+    text = "Jane Doe\n+1 (555) 123-4567\njane@example.com\nwww.example.com\nSuite 12"
+    assert count_contact_fields(text) == 3
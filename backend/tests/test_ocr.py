@@ -0,0 +1,91 @@
+import asyncio
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+from pydantic import ValidationError
+
+from backend.core import ocr
+from backend.core.config import Settings
+from backend.core.ocr import TesseractProvider
+
+GOOD_TEXT = "Jane Doe\n+1 555 123 4567\njane@example.com"
+
+
+class FakeTesseract:
+    """Stands in for pytesseract; results depend on the requested PSM and the image size."""
+
+    Output = SimpleNamespace(DICT="dict")
+    TesseractNotFoundError = RuntimeError
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    def _result(self, image, config):
+        psm = int(config.split()[-1]) if config else None
+        self.calls.append((psm, image.size))
+        return self.results[psm]
+
+    def image_to_string(self, image, lang, config=""):
+        return self._result(image, config)[0]
+
+    def image_to_data(self, image, lang, config="", output_type=None):
+        return {"conf": [str(self._result(image, config)[1])]}
+
+
+def _image_bytes(size=(2400, 1200)):
+    buffer = BytesIO()
+    Image.new("RGB", size, "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _provider(monkeypatch, results):
+    fake = FakeTesseract(results)
+    monkeypatch.setattr(ocr, "_load_pytesseract", lambda: fake)
+    return fake, TesseractProvider(cascade=True, fast_max_side=600, variants=("3", "11", "6:threshold"))
+
+
+def test_cascade_stops_after_confident_fast_pass(monkeypatch):
+    fake, provider = _provider(monkeypatch, {6: (GOOD_TEXT, 92)})
+    result = asyncio.run(provider.extract_text(_image_bytes()))
+    assert result["ocr_pass"] == "fast"
+    assert result["confidence"] == 0.92
+    assert {size for _, size in fake.calls} == {(600, 300)}
+
+
+def test_cascade_reruns_variants_and_keeps_best(monkeypatch):
+    fake, provider = _provider(
+        monkeypatch,
+        {6: ("Jane Doe", 55), 3: ("Jane Doe\njane@example.com", 80), 11: (GOOD_TEXT, 70)},
+    )
+    result = asyncio.run(provider.extract_text(_image_bytes()))
+    assert result["ocr_pass"] == "full"
+    assert result["variant"] == "psm11:none"
+    assert result["text"] == GOOD_TEXT
+    assert (3, (2400, 1200)) in fake.calls
+
+
+def test_cascade_reports_full_pass_when_fast_result_wins(monkeypatch):
+    fake, provider = _provider(
+        monkeypatch,
+        {6: ("Jane Doe\njane@example.com", 60), 3: ("Jane Doe", 90), 11: ("Jane", 95)},
+    )
+    result = asyncio.run(provider.extract_text(_image_bytes()))
+    assert result["ocr_pass"] == "full"
+    assert result["variant"] == "psm6:downscaled"
+    assert len(fake.calls) == 8
+
+
+def test_single_pass_without_cascade(monkeypatch):
+    fake = FakeTesseract({None: (GOOD_TEXT, 90)})
+    monkeypatch.setattr(ocr, "_load_pytesseract", lambda: fake)
+    result = asyncio.run(TesseractProvider().extract_text(_image_bytes()))
+    assert result == {"text": GOOD_TEXT, "confidence": 0.9, "ocr_pass": "single"}
+
+
+@pytest.mark.parametrize("variants", ["3,x", "11:blur", "3,99"])
+def test_invalid_cascade_variants_fail_at_settings_load(variants):
+    with pytest.raises(ValidationError):
+        Settings(ocr_cascade_variants=variants)
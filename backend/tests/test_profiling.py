@@ -0,0 +1,95 @@
+from fastapi.testclient import TestClient
+
+from backend.core.config import get_settings
+from backend.main import app
+
+client = TestClient(app)
+
+
+def test_admin_endpoints_disabled_without_token():
+    assert client.get("/admin/profiles").status_code == 404
+
+
+def test_profile_header_captures_request(monkeypatch):
+    monkeypatch.setattr(get_settings(), "profile_admin_token", "secret")
+    monkeypatch.setattr(get_settings(), "slow_request_ms", 0)
+
+    client.get("/health", headers={"X-Profile": "secret"})
+
+    assert client.get("/admin/profiles", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    summaries = client.get("/admin/profiles", headers={"X-Admin-Token": "secret"}).json()["profiles"]
+    assert summaries[0]["path"] == "/health"
+    assert summaries[0]["reason"] == "sampled"
+
+    detail = client.get(f"/admin/profiles/{summaries[0]['id']}", headers={"X-Admin-Token": "secret"}).json()
+    assert [stage["name"] for stage in detail["profile"]["stages"]] == ["total"]
+
+
+def test_slow_requests_capture_stages(monkeypatch):
+    monkeypatch.setattr(get_settings(), "profile_admin_token", "secret")
+    monkeypatch.setattr(get_settings(), "slow_request_ms", 0.001)
+
+    async def fake_process(_: bytes):
+        from backend.core.profiling import stage
+
+        with stage("ocr"):
+            pass
+        return {"contacts": [], "meta": {}}
+
+    monkeypatch.setattr("backend.routes.extract.process_contact_image", fake_process)
+    client.post("/extract/", files={"file": ("card.png", b"slow-card", "image/png")})
+
+    profiles = client.get("/admin/profiles", headers={"X-Admin-Token": "secret"}).json()["profiles"]
+    slow = next(p for p in profiles if p["path"] == "/extract/")
+    assert slow["reason"] == "slow"
+    detail = client.get(f"/admin/profiles/{slow['id']}", headers={"X-Admin-Token": "secret"}).json()["profile"]
+    assert {"ocr", "save", "total"} <= {stage["name"] for stage in detail["stages"]}
+
+
+def test_sampled_stacks_are_scoped(monkeypatch):
+    monkeypatch.setattr(get_settings(), "profile_admin_token", "secret")
+    monkeypatch.setattr(get_settings(), "profile_sample_interval_ms", 1.0)
+
+    async def slow_process(_: bytes):
+        import asyncio
+        import time
+
+        await asyncio.to_thread(time.sleep, 0.05)
+        time.sleep(0.05)
+        return {"contacts": [], "meta": {}}
+
+    monkeypatch.setattr("backend.routes.extract.process_contact_image", slow_process)
+    client.post("/extract/", files={"file": ("card.png", b"scoped-card", "image/png")}, headers={"X-Profile": "secret"})
+
+    profiles = client.get("/admin/profiles", headers={"X-Admin-Token": "secret"}).json()["profiles"]
+    sampled = next(p for p in profiles if p["path"] == "/extract/" and p["reason"] == "sampled")
+    detail = client.get(f"/admin/profiles/{sampled['id']}", headers={"X-Admin-Token": "secret"}).json()["profile"]
+    scopes = {sample["scope"] for sample in detail["samples"]}
+    assert scopes <= {"request", "process"}
+    assert "request" in scopes
+
+
+def test_request_sql_is_capped_and_skipped_for_streams(monkeypatch):
+    from types import SimpleNamespace
+
+    from backend.core.profiling import after_cursor_execute, before_cursor_execute, begin_request, end_request
+
+    monkeypatch.setattr(get_settings(), "profile_max_sql_entries", 3)
+    conn = SimpleNamespace(info={})
+
+    def run_statements(count):
+        for _ in range(count):
+            before_cursor_execute(conn, None, "SELECT 1", (), None, False)
+            after_cursor_execute(conn, None, "SELECT 1", (), None, False)
+
+    profile, token = begin_request("GET", "/contacts/", False)
+    run_statements(5)
+    end_request(profile, token, 200)
+    assert len(profile.sql) == 3
+    assert profile.sql_dropped == 2
+
+    stream, token = begin_request("GET", "/contacts/changes/stream", False)
+    stream.streaming = True
+    run_statements(5)
+    end_request(stream, token, 200)
+    assert stream.sql == [] and stream.sql_dropped == 0
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from backend.core.shared_store import SharedStore
+from backend.services.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": 42}
+
+    async def scenario():
+        return await asyncio.gather(*(flight.run("k", work) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert [result for result, _ in results] == [{"value": 42}] * 5
+    assert sorted(status for _, status in results) == ["coalesced"] * 4 + ["executed"]
+
+
+def test_failures_are_not_remembered():
+    flight = SingleFlight()
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("boom")
+        return "ok"
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await flight.run("k", flaky)
+        return await flight.run("k", flaky)
+
+    assert asyncio.run(scenario()) == ("ok", "executed")
+
+
+def test_completed_results_expire():
+    flight = SingleFlight(ttl_seconds=0)
+    calls = []
+
+    async def work():
+        calls.append(1)
+        return len(calls)
+
+    async def scenario():
+        await flight.run("k", work)
+        return await flight.run("k", work)
+
+    assert asyncio.run(scenario()) == (2, "executed")
+
+
+def test_shared_store_coalesces_across_instances(tmp_path):
+    # Two SingleFlight instances over one store stand in for two worker processes.
+    store = SharedStore(str(tmp_path / "shared.db"))
+    first = SingleFlight(store=store, namespace="t", poll_seconds=0.01)
+    second = SingleFlight(store=store, namespace="t", poll_seconds=0.01)
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": len(calls)}
+
+    async def scenario():
+        return await asyncio.gather(first.run("k", work), second.run("k", work))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert [result for result, _ in results] == [{"value": 1}] * 2
+    assert sorted(status for _, status in results) == ["coalesced", "executed"]
+
+
+def test_shared_store_leases_and_token_bucket(tmp_path):
+    store = SharedStore(str(tmp_path / "shared.db"))
+    assert store.try_acquire("llm", "a", 2, 60)
+    assert store.try_acquire("llm", "b", 2, 60)
+    assert not store.try_acquire("llm", "c", 2, 60)
+    store.release("llm", "a")
+    assert store.try_acquire("llm", "c", 2, 60)
+    assert store.try_acquire("expired", "a", 1, 0)
+    assert store.try_acquire("expired", "b", 1, 60)
+
+    assert store.take_token("rate", 1.0, 2) == 0
+    assert store.take_token("rate", 1.0, 2) == 0
+    assert store.take_token("rate", 1.0, 2) > 0
+
+
+def test_shared_store_prunes_expired_cache_entries(tmp_path):
+    store = SharedStore(str(tmp_path / "shared.db"), prune_interval_seconds=0)
+    store.set("t", "old", {"v": 1}, -1)
+    store.set("t", "new", {"v": 2}, 60)
+    assert store.get("t", "old") is None
+    assert store._connection().execute("SELECT count(*) FROM cache").fetchone() == (1,)
+
+
+def test_shared_store_set_if_absent_keeps_first_value(tmp_path):
+    store = SharedStore(str(tmp_path / "shared.db"))
+
+    async def scenario():
+        return await asyncio.gather(*(store.aset_if_absent("k", "key-1", f"digest-{i}", 60) for i in range(8)))
+
+    results = asyncio.run(scenario())
+    assert len(set(results)) == 1
+    assert store.get("k", "key-1") == results[0]
+    assert store.set_if_absent("k", "expired", "a", -1) == "a"
+    assert store.set_if_absent("k", "expired", "b", 60) == "b"
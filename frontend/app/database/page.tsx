@@ -4,7 +4,20 @@ import React, { useState } from "react";
 import { SearchBar } from "../components/SearchBar";
 import { ContactList, ContactSummary } from "../components/ContactList";
 import { ErrorCallout } from "../components/ErrorCallout";
-import { searchContacts, DatabaseContact, deduplicateContacts, ContactPayload } from "../../lib/client";
+import { searchContacts, getContactChanges, DatabaseContact, deduplicateContacts, ContactPayload } from "../../lib/client";
+
+function toSummary(c: DatabaseContact): ContactSummary {
+  return {
+    id: c.id.toString(),
+    name: c.name,
+    phone: c.phone,
+    email: c.email,
+    company: c.company,
+    notes: c.notes,
+    confidence: c.confidence,
+    extra: c.extra,
+  };
+}
 
 export default function DatabasePage() {
   const [contacts, setContacts] = useState<ContactSummary[]>([]);
@@ -14,6 +27,8 @@ export default function DatabasePage() {
   const [searchInfo, setSearchInfo] = useState<string | null>(null);
   const [dedupeInfo, setDedupeInfo] = useState<string | null>(null);
   const [lastQuery, setLastQuery] = useState<string>("");
+  const [lastSeq, setLastSeq] = useState<number>(0);
+  const [total, setTotal] = useState<number>(0);
 
   const handleSearch = async (query: string) => {
     setError(null);
@@ -23,18 +38,11 @@ export default function DatabasePage() {
 
     try {
       const response = await searchContacts(query);
-      const mappedContacts: ContactSummary[] = response.contacts.map((c: DatabaseContact) => ({
-        id: c.id.toString(),
-        name: c.name,
-        phone: c.phone,
-        email: c.email,
-        company: c.company,
-        notes: c.notes,
-        confidence: c.confidence,
-        extra: c.extra,
-      }));
+      const mappedContacts: ContactSummary[] = response.contacts.map(toSummary);
       
       setContacts(mappedContacts);
+      setLastSeq(response.last_seq ?? 0);
+      setTotal(response.total);
       setSearchInfo(
         query
           ? `Found ${response.total} contact${response.total !== 1 ? 's' : ''} matching "${query}"`
@@ -48,6 +56,43 @@ export default function DatabasePage() {
     }
   };
 
+  // Apply only what changed since the last load; filtered views still reload through the search.
+  const syncChanges = async () => {
+    if (lastQuery) {
+      await handleSearch(lastQuery);
+      return;
+    }
+
+    let since = lastSeq;
+    let next = contacts;
+    let nextTotal = total;
+    let hasMore = true;
+    while (hasMore) {
+      const delta = await getContactChanges(since);
+      for (const change of delta.changes) {
+        const id = change.id.toString();
+        const updated = change.contact ? toSummary(change.contact) : null;
+        if (!updated) {
+          next = next.filter((c) => c.id !== id);
+          nextTotal = Math.max(nextTotal - 1, 0);
+        } else if (next.some((c) => c.id === id)) {
+          next = next.map((c) => (c.id === id ? updated : c));
+        } else if (change.op === "create") {
+          // Updates to rows outside the loaded page are not new contacts, so only creates are prepended.
+          next = [updated, ...next];
+          nextTotal += 1;
+        }
+      }
+      since = delta.last_seq;
+      hasMore = delta.has_more;
+    }
+
+    setContacts(next);
+    setLastSeq(since);
+    setTotal(nextTotal);
+    setSearchInfo(`Showing ${nextTotal} contact${nextTotal !== 1 ? 's' : ''} from database`);
+  };
+
   // Load all contacts on mount
   React.useEffect(() => {
     handleSearch("");
@@ -108,8 +153,8 @@ export default function DatabasePage() {
         
         setDedupeInfo(`✨ Successfully merged ${duplicates_found} duplicate${duplicates_found !== 1 ? 's' : ''} (${original_count} → ${merged_count} contacts)`);
         
-        // Reload contacts from database
-        await handleSearch("");
+        // Pull only the merge's deletes and inserts from the change feed
+        await syncChanges();
       } else {
         setDedupeInfo(`✅ No duplicates found! All contacts are unique.`);
       }
@@ -135,8 +180,8 @@ export default function DatabasePage() {
         throw new Error("Failed to delete contact");
       }
 
-      // Reload the list
-      await handleSearch(lastQuery);
+      // Apply the deletion from the change feed
+      await syncChanges();
       
       setDedupeInfo("✅ Contact deleted successfully");
       
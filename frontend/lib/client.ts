@@ -90,6 +90,20 @@ export interface SearchResponse {
   total: number;
   limit: number;
   offset: number;
+  last_seq?: number;
+}
+
+export interface ContactChange {
+  seq: number;
+  op: "create" | "update" | "delete";
+  id: number;
+  contact: DatabaseContact | null;
+}
+
+export interface ChangesResponse {
+  changes: ContactChange[];
+  last_seq: number;
+  has_more: boolean;
 }
 
 export async function searchContacts(query: string = "", limit: number = 100, offset: number = 0): Promise<SearchResponse> {
@@ -113,3 +127,12 @@ export async function getContactsByName(name: string): Promise<{ contacts: Datab
   }
   return await response.json();
 }
+
+export async function getContactChanges(since: number): Promise<ChangesResponse> {
+  const params = new URLSearchParams({ since: since.toString() });
+  const response = await fetch(`${apiBaseUrl}/contacts/changes?${params}`);
+  if (!response.ok) {
+    throw new Error(`Sync failed (${response.status})`);
+  }
+  return await response.json() as ChangesResponse;
+}